@@ -0,0 +1,104 @@
+'''
+callback_timer.py
+
+Rolling timing statistics for handler callbacks connected to high rate
+STATUS signals such as 'periodic'. This is qtgui's copy, keep it in step
+with qtplasmac/callback_timer.py.
+
+This program is free software; you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the
+Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+'''
+
+import os
+import time
+from collections import deque
+
+# the gui cycle time in seconds from [DISPLAY]CYCLE_TIME
+# values of 1 or more are milliseconds, qtvcp defaults to 100 ms
+def cycle_time(ini):
+    try:
+        cycle = float(ini.find('DISPLAY', 'CYCLE_TIME') or 0.1)
+    except:
+        cycle = 0.1
+    return cycle / 1000 if cycle >= 1 else cycle
+
+# time each wrapped callback and keep a rolling window of durations for percentiles
+# each callback has a share of the gui cycle, the warn function is called
+# the first time a callback takes longer than its share
+class CallbackTimer:
+    reportFile = '/tmp/qtplasmac/callback_timing.txt'
+    points = (50, 90, 99)
+
+    def __init__(self, cycleTime, warn=None, window=600, reportFile=None):
+        self.cycleTime = cycleTime
+        self.reportFile = reportFile or self.reportFile
+        self.warn = warn
+        self.window = window
+        self.samples = {}
+        self.shares = {}
+        self.calls = {}
+        self.overruns = {}
+        self.warned = set()
+
+    def add(self, name, share=0.5):
+        self.samples[name] = deque(maxlen=self.window)
+        self.shares[name] = share
+        self.calls[name] = 0
+        self.overruns[name] = 0
+        self.warned.discard(name)
+
+    def wrap(self, name, function, share=0.5):
+        self.add(name, share)
+        def timed(*args, **kwargs):
+            startTime = time.monotonic()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(name, time.monotonic() - startTime)
+        return timed
+
+    def record(self, name, duration):
+        if name not in self.samples:
+            self.add(name)
+        self.samples[name].append(duration)
+        self.calls[name] += 1
+        if duration > self.budget(name):
+            self.overruns[name] += 1
+            if name not in self.warned:
+                self.warned.add(name)
+                if self.warn:
+                    self.warn(name, duration, self.budget(name))
+
+    def budget(self, name):
+        return self.cycleTime * self.shares[name]
+
+    def percentiles(self, name):
+        samples = sorted(self.samples[name])
+        if not samples:
+            return {}
+        result = {point: samples[min(len(samples) - 1, len(samples) * point // 100)] for point in self.points}
+        result['max'] = samples[-1]
+        return result
+
+    def report(self):
+        lines = ['{:<24}{:>8}{:>9}{:>9}{:>9}{:>9}{:>9}{:>9}'.format( \
+                 'callback', 'calls', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms', 'budget', 'overrun')]
+        for name in sorted(self.samples):
+            result = self.percentiles(name)
+            if not result:
+                continue
+            times = ['{:0.2f}'.format(result[point] * 1000) for point in self.points + ('max',)]
+            lines.append('{:<24}{:>8}{:>9}{:>9}{:>9}{:>9}{:>9.1f}{:>9}'.format( \
+                         name, self.calls[name], *times, self.budget(name) * 1000, self.overruns[name]))
+        return '\n'.join(lines)
+
+    def write_report(self):
+        try:
+            if not os.path.isdir(os.path.dirname(self.reportFile)):
+                os.makedirs(os.path.dirname(self.reportFile))
+            with open(self.reportFile, 'w') as outFile:
+                outFile.write('{}\n'.format(self.report()))
+        except:
+            pass
@@ -0,0 +1,122 @@
+'''
+ini_model.py
+
+Typed view of the machine INI file for qtgui_handler.py. The file is
+parsed once and only parsed again when it is modified. This is qtgui's
+copy, keep it in step with qtplasmac/ini_model.py.
+
+This program is free software; you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the
+Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+'''
+
+import os
+
+MODELS = {}
+
+# one model per INI file for every user in the process
+def ini_model(path):
+    if path not in MODELS:
+        MODELS[path] = IniModel(path)
+    return MODELS[path]
+
+# sections hold a list of values for each option, find returns the first value
+# like linuxcnc.ini and converts it to the requested type, typed values are
+# cached until the file modification time changes
+class IniModel:
+    axisOptions = ('MIN_LIMIT', 'MAX_LIMIT', 'MAX_VELOCITY', 'MAX_ACCELERATION', 'OFFSET_AV_RATIO')
+    jointOptions = ('MIN_LIMIT', 'MAX_LIMIT', 'MAX_VELOCITY', 'MAX_ACCELERATION', 'HOME_SEQUENCE')
+
+    def __init__(self, path):
+        self.path = path
+        self.mtime = None
+        self.sections = {}
+        self.values = {}
+        self.refresh()
+
+    def refresh(self):
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self.mtime:
+            self.mtime = mtime
+            self.sections = self.parse(self.path)
+            self.values = {}
+
+    @staticmethod
+    def parse(path):
+        sections = {}
+        options = None
+        with open(path, 'r') as inFile:
+            for line in inFile:
+                line = line.strip()
+                if not line or line[0] in '#;':
+                    continue
+                if line[0] == '[' and line[-1] == ']':
+                    options = sections.setdefault(line[1:-1].strip(), {})
+                elif options is not None and '=' in line:
+                    option, value = line.split('=', 1)
+                    options.setdefault(option.strip(), []).append(value.strip())
+        return sections
+
+    def find(self, section, option, default=None, type=str):
+        self.refresh()
+        key = (section, option, type)
+        if key not in self.values:
+            try:
+                self.values[key] = type(self.sections[section][option][0])
+            except (KeyError, IndexError, ValueError):
+                return default
+        return self.values[key]
+
+    def findall(self, section, option):
+        self.refresh()
+        return list(self.sections.get(section, {}).get(option, []))
+
+    def section(self, section):
+        self.refresh()
+        return {option: values[0] for option, values in self.sections.get(section, {}).items()}
+
+    def axis(self, letter):
+        section = 'AXIS_{}'.format(letter.upper())
+        return {option.lower(): self.find(section, option, None, float) for option in self.axisOptions}
+
+    def joint(self, joint):
+        section = 'JOINT_{}'.format(joint)
+        values = {option.lower(): self.find(section, option, None, float) for option in self.jointOptions[:-1]}
+        values['home_sequence'] = self.find(section, 'HOME_SEQUENCE')
+        return values
+
+    def joints(self):
+        return self.find('KINS', 'JOINTS', 0, int)
+
+    def units(self):
+        return self.find('TRAJ', 'LINEAR_UNITS')
+
+    # [KINS]KINEMATICS arguments without the module name, None if there are none
+    def kinematics(self):
+        kinematics = (self.find('KINS', 'KINEMATICS') or '').lower()
+        return kinematics.replace('=', '').replace('trivkins', '').replace(' ', '') or None
+
+    # coordinates from the kinematics arguments, None if not specified
+    def coordinates(self):
+        kinematics = self.kinematics() or ''
+        if 'kinstype' in kinematics and 'coordinates' in kinematics:
+            kinematics = kinematics.split('kinstype')[0]
+        if 'coordinates' in kinematics:
+            return kinematics.split('coordinates')[1]
+        return None
+
+    def increments(self):
+        return (self.find('DISPLAY', 'INCREMENTS') or '').replace(',', ' ').split()
+
+    def ud_params(self):
+        params = {}
+        for option, value in self.section('UD_PARAMS').items():
+            try:
+                params[option] = float(value)
+            except ValueError:
+                params[option] = value
+        return params
@@ -3,12 +3,12 @@
 ############################
 
 import os
+import time
 import subprocess
 import hal
 import linuxcnc
 import math
 
-from hal_glib import GStat
 from PyQt5 import QtCore, QtWidgets
 from qtvcp.widgets.mdi_line import MDILine as MDI_WIDGET
 from qtvcp.widgets.gcode_editor import GcodeEditor as GCODE
@@ -16,6 +16,9 @@ from qtvcp.widgets.stylesheeteditor import  StyleSheetEditor as SSE
 from qtvcp.lib.keybindings import Keylookup
 from qtvcp.lib.aux_program_loader import Aux_program_loader
 from qtvcp.core import Status, Action, Info
+from callback_timer import CallbackTimer, cycle_time
+from mdi_queue import MdiQueue
+from ini_model import ini_model
 
 
 # Set up logging
@@ -36,7 +39,77 @@ INFO = Info()
 STYLEEDITOR = SSE()
 TCLPATH = os.environ['LINUXCNC_TCL_DIR']
 INIPATH = os.environ.get('INI_FILE_NAME', '/dev/null')
-GSTAT = GStat()
+INI = ini_model(INIPATH)
+##################################
+# **** HELPER CLASS SECTION **** #
+##################################
+
+# home all joints without blocking the gui
+# teleop is disabled for homing and enabled again when STATUS reports all homed
+# homing is aborted if it has not finished within the timeout
+class HomingController:
+    ackTimeout = 0.5
+
+    def __init__(self, cmd, joints, timeout=120.0, progress=None, done=None):
+        self.cmd = cmd
+        self.joints = joints
+        self.timeout = timeout
+        self.progress = progress
+        self.done = done
+        self.active = False
+        self.homed = set()
+        self.started = 0
+        STATUS.connect('homed', lambda w, joint: self.joint_homed(joint))
+        STATUS.connect('all-homed', lambda w: self.all_homed())
+        STATUS.connect('periodic', lambda w: self.check_timeout())
+
+    def home(self):
+        self.homed = set()
+        self.active = True
+        self.started = time.monotonic()
+        self.send(self.cmd.teleop_enable, False)
+        self.send(self.cmd.home, -1)
+        self.report()
+
+    def unhome(self):
+        self.active = False
+        self.send(self.cmd.teleop_enable, False)
+        self.send(self.cmd.unhome, -1)
+
+    def cancel(self):
+        if self.active:
+            self.active = False
+            if self.done:
+                self.done(False)
+
+    # task acknowledges these commands within a few cycles
+    def send(self, command, arg):
+        command(arg)
+        self.cmd.wait_complete(self.ackTimeout)
+
+    def joint_homed(self, joint):
+        if self.active:
+            self.homed.add(int(joint))
+            self.report()
+
+    def all_homed(self):
+        if not self.active:
+            return
+        self.active = False
+        self.send(self.cmd.teleop_enable, True)
+        if self.done:
+            self.done(True)
+
+    def check_timeout(self):
+        if self.active and time.monotonic() - self.started > self.timeout:
+            LOG.error('Homing did not finish within %.0f seconds, homed joints: %s' % (self.timeout, sorted(self.homed)))
+            self.cmd.abort()
+            self.cancel()
+
+    def report(self):
+        if self.progress:
+            self.progress(sorted(self.homed), self.joints)
+
 ###################################
 # **** HANDLER CLASS SECTION **** #
 ###################################
@@ -52,9 +125,15 @@ class HandlerClass:
         self.PATHS = paths
         self.stat = linuxcnc.stat()
         self.cmd = linuxcnc.command()
-        self.inifile = linuxcnc.ini(INIPATH)
-        self.coordinates = self.inifile.find('TRAJ', 'COORDINATES')
+        self.coordinates = INI.find('TRAJ', 'COORDINATES')
+        self.callbackTimer = CallbackTimer(cycle_time(INI), self.callback_overrun)
+        self.mdi_queue = MdiQueue(STATUS, self.mdi_send, self.mdi_finish)
+        self.homing = HomingController(self.cmd, INI.joints() or len(self.coordinates),
+                                       progress=self.homing_progress, done=self.homing_done)
         self.g5x_dro = 'g54'
+        self.dro_layout = None
+        self.dro_count = 0
+        self.dro_text = []
         self.mdi_pbuttons = ('pb_g0x0y0_zsafe', 'pb_g92x0y0z0', 'pb_g92x0',
                              'pb_g92y0', 'pb_g92z0', 'pb_g53xmax_ymax',
                              )
@@ -67,6 +146,7 @@ class HandlerClass:
     # the HAL pins are built but HAL is not set ready
     def initialized__(self):
         KEYBIND.add_call('Key_F12', 'on_keycall_F12')
+        KEYBIND.add_call('Key_F11', 'on_keycall_F11')
         self.w.pb_estop.setCheckable(True)
         self.w.pb_estop.setChecked(True)
         self.w.pb_estop.toggled.connect(self.estop_change)
@@ -101,12 +181,14 @@ class HandlerClass:
         for i in self.mdi_pbuttons:
             command = i.replace('pb_', '')
             self.w[i].clicked.connect(lambda w, cmd=command: self.mdi_commands(cmd))
-        STATUS.connect('periodic', self.motion_mode)
+        STATUS.connect('periodic', self.callbackTimer.wrap('motion_mode', self.motion_mode))
         STATUS.connect('state-estop', lambda w: self.estop_state(True))
 
     def estop_state(self, state):
         if isinstance(state, bool):
             if state:
+                self.mdi_queue.clear()
+                self.homing.cancel()
                 self.w.pb_estop.setChecked(True)
                 self.w.pb_power.setChecked(False)
                 self.w.pb_power.setEnabled(False)
@@ -131,19 +213,22 @@ class HandlerClass:
                 self.cmd.state(linuxcnc.STATE_OFF)
 
     def homing_state(self, state):
-        self.stat.poll()
         if isinstance(state, bool) and linuxcnc.MODE_MANUAL:
             if state:
-                self.cmd.teleop_enable(False)
-                self.cmd.home(-1)
-                self.cmd.wait_complete()
-                self.cmd.teleop_enable(True)
-                self.cmd.wait_complete()
+                self.homing.home()
             else:
-                self.cmd.teleop_enable(False)
-                self.cmd.unhome(-1)
-                self.cmd.wait_complete()
-        self.stat.poll()
+                self.homing.unhome()
+
+    def homing_progress(self, homed, joints):
+        self.w.pb_home_all.setText('Homing %s/%s' % (len(homed), joints))
+
+    # uncheck the button without unhoming if homing failed
+    def homing_done(self, success):
+        self.w.pb_home_all.setText('Home All')
+        if not success:
+            self.w.pb_home_all.blockSignals(True)
+            self.w.pb_home_all.setChecked(False)
+            self.w.pb_home_all.blockSignals(False)
 
     def g5x_dro_change(self):
         if self.g5x_dro == 'g54':
@@ -155,80 +240,71 @@ class HandlerClass:
         self.w.label_5.setText(str(self.g5x_dro))
 
 # TODO доделаль вызовы движения для кнопок dro
+    # the layout is only built when the motion mode changes
+    # positions come from the STATUS poll and labels are only set when the text changes
     def motion_mode(self, *args, **kwargs):
-        if self.stat.motion_mode == 1:
-            self.show_joints()
+        layout = (STATUS.stat.motion_mode, self.coordinates)
+        if layout != self.dro_layout:
+            self.dro_layout = layout
+            if STATUS.stat.motion_mode == 1:
+                self.show_joints()
+            else:
+                self.show_axes()
+        if STATUS.stat.motion_mode == 1:
+            coord = STATUS.stat.joint_position
         else:
-            self.show_axes()
+            pos = STATUS.stat.actual_position
+            if self.g5x_dro == 'g54':
+                offset = STATUS.stat.g92_offset
+                coord = (pos[0] - offset[0], pos[1] - offset[1], pos[2] - offset[2])
+            else:
+                coord = pos[:3]
+        for i in range(0, self.dro_count):
+            text = '%.2f' % coord[i]
+            if self.dro_text[i] != text:
+                self.dro_text[i] = text
+                self.w['dro_label_%s' % i].setText(text)
 
     def show_joints(self, *args, **kwargs):
-        self.stat.poll()
-        pos = self.stat.joint_position
-        join_0 = pos[0]
-        join_1 = pos[1]
-        join_2 = pos[2]
-        join_3 = pos[3]
-        coord = (join_0, join_1, join_2, join_3)
-        for i in range(0, 4):
-            self.w['lbl_axis_%s' % i].close()
-            self.w['dro_label_%s' % i].close()
-            self.w['pb_jog_%s_plus' % i].close()
-            self.w['pb_jog_%s_minus' % i].close()
-        for i in range(0, len(self.coordinates)):
-            self.w['lbl_axis_%s' % i].show()
-            self.w['lbl_axis_%s' % i].setText('%s' % i)
-            self.w['dro_label_%s' % i].show()
-            self.w['dro_label_%s' % i].setText('%.2f' % coord[i])
-            self.w['pb_jog_%s_plus' % i].show()
-            self.w['pb_jog_%s_minus' % i].show()
+        self.show_dro([str(i) for i in range(0, len(self.coordinates))])
 
     def show_axes(self, *args, **kwargs):
-        self.stat.poll()
-        pos = self.stat.actual_position
-        offset = self.stat.g92_offset
-        if self.g5x_dro == 'g54':
-            x = pos[0] - offset[0]
-            y = pos[1] - offset[1]
-            z = pos[2] - offset[2]
-            coord = (x, y, z,)
-        else:
-            x = pos[0]
-            y = pos[1]
-            z = pos[2]
-            coord = (x, y, z,)
+        self.show_dro(['XYZ'[i] for i in range(0, len(set(self.coordinates)))])
+
+    def show_dro(self, names):
         for i in range(0, 4):
-            self.w['lbl_axis_%s' % i].close()
-            self.w['dro_label_%s' % i].close()
-            self.w['pb_jog_%s_plus' % i].close()
-            self.w['pb_jog_%s_minus' % i].close()
-        for i in range(0, len(set(self.coordinates))):
-            axis_name = "XYZ"[i]
-            self.w['lbl_axis_%s' % i].show()
-            self.w['lbl_axis_%s' % i].setText('%s'% axis_name)
-            self.w['dro_label_%s' % i].show()
-            self.w['dro_label_%s' % i].setText('%.2f' % coord[i])
-            self.w['pb_jog_%s_plus' % i].show()
-            self.w['pb_jog_%s_minus' % i].show()
+            visible = i < len(names)
+            self.w['lbl_axis_%s' % i].setVisible(visible)
+            self.w['dro_label_%s' % i].setVisible(visible)
+            self.w['pb_jog_%s_plus' % i].setVisible(visible)
+            self.w['pb_jog_%s_minus' % i].setVisible(visible)
+            if visible:
+                self.w['lbl_axis_%s' % i].setText(names[i])
+        self.dro_count = len(names)
+        self.dro_text = [None] * self.dro_count
 
     def mdi_commands(self, mdi):
         if mdi == 'g53xmax_ymax':
-            y_coord = self.inifile.find('AXIS_Y', 'MAX_LIMIT')
-            x_max = self.inifile.find('AXIS_X', 'MAX_LIMIT')
-            x_min = self.inifile.find('AXIS_X', 'MIN_LIMIT')
-            if abs(float(x_min)) > float(x_max):
-                x_coord = x_min
+            x_axis = INI.axis('x')
+            y_coord = INI.axis('y')['max_limit']
+            if abs(x_axis['min_limit']) > x_axis['max_limit']:
+                x_coord = x_axis['min_limit']
             else:
-                x_coord = x_max
+                x_coord = x_axis['max_limit']
             mdi = 'g53g0 x %s y %s' % (x_coord, y_coord)
         if mdi == 'g0x0y0_zsafe':
-            safe = self.inifile.find('UD_PARAMS', 'SAFE_Z')
+            safe = INI.find('UD_PARAMS', 'SAFE_Z', type=float)
             mdi = mdi.replace('_zsafe', 'z %s' % safe)
-        self.cmd.mode(linuxcnc.MODE_MDI)
-        self.cmd.wait_complete()
+        self.mdi_queue.put(mdi)
+
+    # called by the mdi queue, the mode is only changed when needed
+    def mdi_send(self, mdi):
+        if not STATUS.is_mdi_mode():
+            self.cmd.mode(linuxcnc.MODE_MDI)
+            self.cmd.wait_complete()
         self.cmd.mdi('%s' % mdi)
-        while not GSTAT.is_interp_idle():
-            self.w.gcodegraphics.updateGL()
-            QtWidgets.QApplication.processEvents()
+
+    def mdi_finish(self):
         self.cmd.mode(linuxcnc.MODE_MANUAL)
 
     def sw_other_tab_change(self, num):
@@ -332,6 +408,16 @@ class HandlerClass:
     # general functions #
     #####################
 
+    # warn once when a periodic callback takes more than its share of the cycle
+    def callback_overrun(self, name, duration, budget):
+        LOG.warning('%s overran its share of the GUI cycle: %.1f ms > %.1f ms' % (name, duration * 1000, budget * 1000))
+
+    def callback_timing_show(self):
+        msg = QtWidgets.QMessageBox(self.w)
+        msg.setWindowTitle('Callback Timing')
+        msg.setText('<pre>%s\n\n%s</pre>' % (self.callbackTimer.report(), self.mdi_queue.report()))
+        msg.exec_()
+
     # keyboard jogging from key binding calls
     # double the rate if fast is true 
     def kb_jog(self, state, joint, direction, fast = False, linear = True):
@@ -372,7 +458,11 @@ class HandlerClass:
             if STATUS.stat.interp_state == linuxcnc.INTERP_IDLE:
                 self.w.close()
             else:
+                self.mdi_queue.clear()
                 self.cmnd.abort()
+    def on_keycall_F11(self,event,state,shift,cntrl):
+        if state:
+            self.callback_timing_show()
     def on_keycall_F12(self,event,state,shift,cntrl):
         if state:
             STYLEEDITOR.load_dialog()
@@ -408,6 +498,9 @@ class HandlerClass:
     # **** closing event **** #
     ###########################
 
+    def closing_cleanup__(self):
+        self.callbackTimer.write_report()
+
     ##############################
     # required class boiler code #
     ##############################
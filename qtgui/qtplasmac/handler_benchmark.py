@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+'''
+handler_benchmark.py
+
+Headless benchmark for qtplasmac_handler.py
+
+The handler is constructed on the offscreen Qt platform with stub
+linuxcnc, hal, qtvcp and Qsci modules and a registry of real widgets so
+regressions can be measured without a machine or a running LinuxCNC.
+
+usage: python3 handler_benchmark.py [-n ITERATIONS] [-o REPORT.json]
+
+This program is free software; you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the
+Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+'''
+
+import os
+import sys
+import time
+import json
+import types
+import shutil
+import tempfile
+import argparse
+import configparser
+import traceback
+from unittest.mock import MagicMock
+
+os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+from PyQt5.QtWidgets import QApplication, QWidget
+
+HANDLERDIR = os.path.dirname(os.path.realpath(__file__))
+
+
+#########################################################################################################################
+# STUB MODULES #
+#########################################################################################################################
+# a hal pin created by the stub halcomp
+class StubPin:
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+        self.value_changed = MagicMock()
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+class StubHalComp:
+    def __init__(self):
+        self.comp = MagicMock()
+        self.pins = {}
+
+    def newpin(self, name, *args):
+        self.pins[name] = StubPin(name)
+        return self.pins[name]
+
+# a minimal qtvcp preferences file handler
+class Access(configparser.ConfigParser):
+    def __init__(self, path=None):
+        configparser.ConfigParser.__init__(self)
+        self.optionxform = str
+        self.fn = path
+        self.read(path)
+
+    def getpref(self, option, default=False, type=bool, section='DEFAULT'):
+        getters = {bool: self.getboolean, float: self.getfloat, int: self.getint, str: self.get}
+        try:
+            return getters[type](section, option)
+        except:
+            self.putpref(option, default, type, section)
+            return type(default)
+
+    def putpref(self, option, value, type=bool, section='DEFAULT'):
+        if section != 'DEFAULT' and not self.has_section(section):
+            self.add_section(section)
+        self.set(section, option, str(type(value)))
+        with open(self.fn, 'w') as outFile:
+            self.write(outFile)
+
+class StubIni:
+    def __init__(self, data):
+        self.data = data
+
+    def find(self, section, option):
+        return self.data.get(section, {}).get(option)
+
+    def findall(self, section, option):
+        value = self.find(section, option)
+        return [value] if value else []
+
+# the status object records connections so signals can be emitted by the benchmarks
+class StubStatus(MagicMock):
+    def _get_child_mock(self, **kwargs):
+        return MagicMock(**kwargs)
+
+    def connect(self, signal, callback):
+        self.callbacks.setdefault(signal, []).append(callback)
+
+    def emit(self, signal, *args):
+        for callback in self.callbacks.get(signal, []):
+            callback(self, *args)
+
+# child widgets of the main window are real widgets so they can parent qt objects made by the handler
+# methods that a plain QWidget does not have are mocks with sensible return values for common getters
+class StubWidget(QWidget):
+    defaults = {'value': 1, 'text': '1', 'isChecked': False, 'currentIndex': 0}
+
+    def __init__(self):
+        QWidget.__init__(self)
+        self.rows = 0
+        self.setMaximumHeight(100)
+        self.setStyleSheet('background-color: #ffee06')
+
+    def __getattr__(self, item):
+        if item.startswith('_'):
+            raise AttributeError(item)
+        mock = MagicMock(name=item)
+        if item in self.defaults:
+            mock.return_value = self.defaults[item]
+        setattr(self, item, mock)
+        return mock
+
+# the main window creates a child widget for each widget name on first use
+class StubWindow(QWidget):
+    def __getattr__(self, item):
+        if item.startswith('_'):
+            raise AttributeError(item)
+        widget = StubWidget()
+        setattr(self, item, widget)
+        return widget
+
+    def __getitem__(self, item):
+        return getattr(self, item)
+
+INI = {'EMC': {'MACHINE': 'benchmark'},
+       'TRAJ': {'LINEAR_UNITS': 'mm'},
+       'AXIS_X': {'MIN_LIMIT': '-5', 'MAX_LIMIT': '1205'},
+       'AXIS_Y': {'MIN_LIMIT': '-5', 'MAX_LIMIT': '1205'},
+       'AXIS_Z': {'MIN_LIMIT': '-60', 'MAX_LIMIT': '0', 'MAX_VELOCITY': '25', 'OFFSET_AV_RATIO': '0.5'},
+       'DISPLAY': {'PROGRAM_PREFIX': tempfile.gettempdir()},
+       'RS274NGC': {'RS274NGC_STARTUP_CODE': 'G21 G40 G49 G80 G90 G92.1 G94 G97 M52P1'},
+       'FILTER': {'ngc': 'qtplasmac_gcode'},
+       'KINS': {'KINEMATICS': 'trivkins coordinates=XYZ', 'JOINTS': '3'},
+      }
+
+def stub_module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+def mock_module(name):
+    sys.modules[name] = MagicMock(name=name)
+    return sys.modules[name]
+
+def install_stubs():
+    status = StubStatus()
+    status.callbacks = {}
+    status.stat.estop = 0
+    status.stat.feedrate = 1.0
+    status.stat.rapidrate = 1.0
+    status.stat.interp_state = 1
+    status.is_interp_idle.return_value = True
+    for name in ['is_auto_paused', 'is_interp_paused', 'is_auto_mode', 'is_interp_running', 'machine_is_on', \
+                 'is_on_and_idle', 'is_all_homed', 'is_joint_mode', 'is_metric_mode', 'estop_is_clear']:
+        getattr(status, name).return_value = False
+    info = MagicMock()
+    info.INI = StubIni(INI)
+    info.AVAILABLE_AXES = ['X', 'Y', 'Z']
+    info.DEFAULT_LINEAR_JOG_VEL = 100
+    # linuxcnc constants all default to 0
+    def constant(name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return 0
+    stub_module('linuxcnc', version='2.9.0:benchmark', ini=StubIni, stat=MagicMock, command=MagicMock, __getattr__=constant)
+    stub_module('hal', HAL_BIT=1, HAL_FLOAT=2, HAL_S32=3, HAL_U32=4, HAL_IN=16, HAL_OUT=32, HAL_IO=48, \
+                get_value=lambda pin: 0.0, set_p=lambda pin, value: None, pin_has_writer=lambda pin: True, \
+                component_exists=lambda comp: False, new_sig=lambda *args: None, connect=lambda *args: None)
+    for name in ['qtvcp', 'qtvcp.lib', 'qtvcp.widgets', 'qtvcp.lib.qtplasmac', 'qtvcp.lib.gcodes', \
+                 'qtvcp.lib.keybindings', 'qtvcp.lib.aux_program_loader', 'qtvcp.lib.qtplasmac.tooltips', \
+                 'qtvcp.lib.qtplasmac.set_offsets', 'qtvcp.lib.qtplasmac.updater', \
+                 'qtvcp.lib.qtplasmac.conversational', 'qtvcp.widgets.camview_widget', \
+                 'qtvcp.widgets.file_manager', 'qtvcp.widgets.gcode_editor', 'qtvcp.widgets.mdi_history', \
+                 'qtvcp.widgets.mdi_line', 'qtvcp.widgets.origin_offsetview', 'qtvcp.widgets.screen_options', \
+                 'qtvcp.widgets.simple_widgets', 'qtvcp.widgets.status_label', 'qtvcp.widgets.stylesheeteditor', \
+                 'plasmac', 'plasmac.run_from_line', 'rs274', 'rs274.glcanon', 'qt5_graphics', 'OpenGL', 'OpenGL.GL', \
+                 'PyQt5.Qsci']:
+        mock_module(name)
+    sys.modules['rs274.glcanon'].GlCanonDraw.extents_info.return_value = ((0, 0, 0), 100)
+    import logging
+    stub_module('qtvcp.logger', getLogger=logging.getLogger)
+    sys.modules['qtvcp'].logger = sys.modules['qtvcp.logger']
+    stub_module('qtvcp.core', Status=lambda: status, Action=MagicMock, Info=lambda: info, Tool=MagicMock)
+    stub_module('qtvcp.lib.preferences', Access=Access)
+    return status
+
+
+#########################################################################################################################
+# BENCHMARKS #
+#########################################################################################################################
+class Benchmark:
+    def __init__(self, iterations):
+        self.iterations = iterations
+        self.results = {}
+        self.configPath = tempfile.mkdtemp(prefix='qtplasmac_bench_')
+        self.status = install_stubs()
+        sys.path.insert(0, HANDLERDIR)
+        os.chdir(self.configPath)
+        self.make_config()
+
+    def make_config(self):
+        with open(os.path.join(self.configPath, 'M190'), 'w') as outFile:
+            outFile.write('#!/usr/bin/env python3\n')
+        with open(os.path.join(self.configPath, 'benchmark.prefs'), 'w') as outFile:
+            outFile.write('[BUTTONS]\n')
+        # reports and caches go in the benchmark directory instead of the user's
+        os.environ['QTPLASMAC_TMPDIR'] = os.path.join(self.configPath, 'tmp')
+        os.environ['QTPLASMAC_CACHEDIR'] = os.path.join(self.configPath, 'cache')
+        # the handler reads the INI file directly through ini_model
+        os.environ['INI_FILE_NAME'] = os.path.join(self.configPath, 'benchmark.ini')
+        with open(os.environ['INI_FILE_NAME'], 'w') as outFile:
+            for section in INI:
+                outFile.write('[{}]\n'.format(section))
+                for option in INI[section]:
+                    outFile.write('{} = {}\n'.format(option, INI[section][option]))
+                outFile.write('\n')
+        with open(os.path.join(self.configPath, 'benchmark_material.cfg'), 'w') as outFile:
+            for material in range(1, 51):
+                outFile.write('[MATERIAL_NUMBER_{}]\nNAME = material {}\nKERF_WIDTH = 1\nPIERCE_HEIGHT = 3\n' \
+                              'PIERCE_DELAY = 0.1\nCUT_HEIGHT = 1\nCUT_SPEED = 4000\n\n'.format(material, material))
+        self.gcodeFile = os.path.join(self.configPath, 'benchmark.ngc')
+        with open(self.gcodeFile, 'w') as outFile:
+            outFile.write('G21\nG0 X10 Y10\nM3 $0 S1\nG1 X100\nG1 Y100\nG1 X10\nG1 Y10\nM5 $0\nM2\n')
+
+    def paths(self):
+        return types.SimpleNamespace(CONFIGPATH=self.configPath, BASEDIR='/usr', IMAGEDIR=HANDLERDIR, \
+                                     SCREENDIR=os.path.dirname(HANDLERDIR), BASEPATH='qtplasmac', \
+                                     XML=os.path.join(HANDLERDIR, 'qtplasmac.ui'))
+
+    def timed(self, name, function, count=1):
+        startTime = time.perf_counter()
+        try:
+            for n in range(count):
+                function()
+            elapsed = time.perf_counter() - startTime
+            self.results[name] = {'count': count, 'total': elapsed, 'mean': elapsed / count}
+        except Exception as err:
+            self.results[name] = {'error': repr(err), 'traceback': traceback.format_exc()}
+
+    def construct(self):
+        import qtplasmac_handler
+        widgets = StubWindow()
+        widgets.PREFS_ = Access(os.path.join(self.configPath, 'qtvcp.prefs'))
+        self.handler = qtplasmac_handler.HandlerClass(StubHalComp(), widgets, self.paths())
+        self.handler.class_patch__()
+        self.handler.initialized__()
+        self.handler.before_loop__()
+        self.handler.startup_timeout()
+
+    def periodic(self):
+        self.status.emit('periodic')
+
+    def materials(self):
+        self.handler.load_materials()
+
+    # the graphics widget emits the program properties before the file is reported as loaded
+    def file_loaded(self):
+        extents = '10.000 to 100.000 = 90.000 mm'
+        self.handler.update_gcode_properties({'gcode_units': 'mm', 'x': extents, 'y': extents, \
+                                              'x_zero_rxy': extents, 'y_zero_rxy': extents})
+        self.handler.file_loaded(None, self.gcodeFile)
+
+    def key_events(self):
+        event = MagicMock()
+        event.isAutoRepeat.return_value = False
+        for key in ['XPOS', 'XNEG', 'YPOS', 'YNEG', 'ZPOS', 'ZNEG']:
+            getattr(self.handler, 'on_keycall_{}'.format(key))(event, True, False, False)
+            getattr(self.handler, 'on_keycall_{}'.format(key))(event, False, False, False)
+
+    def run(self):
+        self.timed('construction', self.construct)
+        if 'error' in self.results['construction']:
+            return
+        self.timed('periodic', self.periodic, self.iterations)
+        self.timed('material load', self.materials, max(1, self.iterations // 10))
+        self.timed('file loaded', self.file_loaded, max(1, self.iterations // 10))
+        self.timed('key dispatch', self.key_events, self.iterations)
+
+    def report(self, outFile=None):
+        for name, result in self.results.items():
+            if 'error' in result:
+                print('{:<16} ERROR {}'.format(name, result['error']))
+            else:
+                print('{:<16} {:>6} x {:>10.3f} ms = {:>9.3f} s'.format(name, result['count'], result['mean'] * 1000, result['total']))
+        if outFile:
+            with open(outFile, 'w') as output:
+                json.dump(self.results, output, indent=2)
+
+    def cleanup(self):
+        shutil.rmtree(self.configPath, ignore_errors=True)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless benchmark for the QtPlasmaC handler')
+    parser.add_argument('-n', '--iterations', type=int, default=1000, help='number of periodic and key iterations')
+    parser.add_argument('-o', '--output', help='write the results to a JSON file')
+    args = parser.parse_args()
+    app = QApplication(sys.argv)
+    bench = Benchmark(args.iterations)
+    try:
+        bench.run()
+        bench.report(args.output)
+    finally:
+        bench.cleanup()
+    sys.exit(1 if [r for r in bench.results.values() if 'error' in r] else 0)
@@ -0,0 +1,217 @@
+'''
+mdi_queue.py
+
+Non-blocking interpreter waits and MDI execution for the QtVCP handlers.
+Work that has to wait for the interpreter to return to idle is continued
+from STATUS signals, so the GUI event loop is never blocked or re-entered.
+qtgui has its own copy in ../mdi_queue.py.
+
+This program is free software; you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the
+Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+'''
+
+import re
+import time
+from collections import deque
+
+# call a function once the interpreter is idle without blocking the gui
+# a wait ends on the STATUS 'interp-idle' signal, waits for commands that finish
+# between two polls end after two idle periodic ticks, the timedOut function is
+# called instead if the interpreter is not idle within timeout seconds
+class IdleWait:
+    idleTicks = 2
+
+    def __init__(self, status):
+        self.status = status
+        self.waiters = []
+        status.connect('interp-idle', lambda w: self.check(True))
+        status.connect('periodic', lambda w: self.check(False))
+
+    def wait(self, function, timeout=None, timedOut=None):
+        deadline = time.monotonic() + timeout if timeout else None
+        self.waiters.append({'function': function, 'deadline': deadline, 'timedOut': timedOut, 'ticks': 0})
+
+    def check(self, signalled):
+        if not self.waiters:
+            return
+        idle = self.status.is_interp_idle()
+        now = time.monotonic()
+        for waiter in list(self.waiters):
+            if waiter not in self.waiters:
+                continue
+            if idle and not signalled:
+                waiter['ticks'] += 1
+            if idle and (signalled or waiter['ticks'] >= self.idleTicks):
+                self.waiters.remove(waiter)
+                waiter['function']()
+            elif waiter['deadline'] and now > waiter['deadline']:
+                self.waiters.remove(waiter)
+                if waiter['timedOut']:
+                    waiter['timedOut']()
+
+    def clear(self):
+        self.waiters = []
+
+# run mdi commands without blocking the gui
+# a job is one command or a list of commands that are sent in order, each
+# command is sent when the previous one is complete, jobs are run in the order
+# they were put so moves always see the offsets written before them, only
+# abort jumps the queue, an offset write replaces the last pending job if that
+# job writes the same or fewer words with the same L and P so repeated touch
+# offs only send the last write, the done functions of a job are called on
+# completion and the finish function is called each time the queue empties
+# abort and clear call the done functions of the dropped jobs with aborted set
+# so they can restore the gui without continuing the work, a job that times
+# out is aborted and its timedOut function is called instead of done
+class MdiQueue:
+    MOTION, OFFSET = 1, 2
+    names = {MOTION: 'motion', OFFSET: 'offset'}
+
+    def __init__(self, status, send, finish=None, abort=None, window=100):
+        self.send = send
+        self.finish = finish
+        self.abortFunction = abort
+        self.idle = IdleWait(status)
+        self.queue = deque()
+        self.current = None
+        self.aborted = False
+        self.maxDepth = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.latency = deque(maxlen=window)
+
+    def put(self, command, done=None, timeout=None, timedOut=None):
+        commands = [command] if isinstance(command, str) else [c for c in command if c]
+        if not commands:
+            if done:
+                done()
+            return
+        keys = [self.offset_key(c) for c in commands]
+        job = {'commands': commands, 'done': [done] if done else [], 'priority': self.OFFSET if all(keys) else self.MOTION, \
+               'timeout': timeout, 'timedOut': timedOut, 'queued': time.monotonic()}
+        last = self.queue[-1] if self.queue else None
+        if last and len(commands) == 1 and keys[0] and len(last['commands']) == 1 and \
+           self.supersedes(keys[0], self.offset_key(last['commands'][0])):
+            self.queue.pop()
+            self.coalesced += 1
+            job['queued'] = last['queued']
+            job['done'] = last['done'] + [d for d in job['done'] if d not in last['done']]
+        self.queue.append(job)
+        self.maxDepth = max(self.maxDepth, self.depth())
+        if not self.current:
+            self.next()
+
+    # (L, P, axis letters) of a G10 L2 or G10 L20 offset write, None if not one
+    @staticmethod
+    def offset_key(command):
+        words = dict(re.findall(r'([A-Z])([^A-Z]*)', command.upper().replace(' ', '')))
+        if words.get('G') not in ('10', '10.') or words.get('L') not in ('2', '20'):
+            return None
+        return (words['L'], words.get('P', '1'), set(words) - set('GLP'))
+
+    @staticmethod
+    def supersedes(new, old):
+        return old is not None and new[:2] == old[:2] and old[2] <= new[2]
+
+    # true if every job in the queue is an offset write that command would
+    # replace, so command can be put while the interpreter is busy with them
+    def coalesces(self, command):
+        key = self.offset_key(command)
+        jobs = ([self.current] if self.current else []) + list(self.queue)
+        return bool(key and jobs) and all(len(job['commands']) == 1 and \
+               self.supersedes(key, self.offset_key(job['commands'][0])) for job in jobs)
+
+    def next(self):
+        if not self.queue:
+            if self.finish:
+                self.finish()
+            return
+        self.current = self.queue.popleft()
+        self.send_command()
+
+    def send_command(self):
+        job = self.current
+        job['sent'] = time.monotonic()
+        self.send(job['commands'][0])
+        self.idle.wait(self.complete, job['timeout'], self.timed_out)
+
+    def record(self, job):
+        self.latency.append((job['commands'].pop(0), job['priority'], \
+                             job['sent'] - job['queued'], time.monotonic() - job['sent']))
+        job['queued'] = time.monotonic()
+
+    def complete(self):
+        job = self.current
+        if not job:
+            return
+        self.record(job)
+        if job['commands']:
+            self.send_command()
+            return
+        self.current = None
+        for done in job['done']:
+            done()
+        self.next()
+
+    # the command that timed out is aborted and the queue holds until the
+    # interpreter is idle so the next job is not sent behind it
+    def timed_out(self):
+        job = self.current
+        if not job:
+            return
+        self.dropped += len(job['commands']) - 1
+        self.record(job)
+        job['commands'], job['done'] = [], []
+        if self.abortFunction:
+            self.abortFunction()
+        if job['timedOut']:
+            job['timedOut']()
+        self.idle.wait(self.resume)
+
+    def resume(self):
+        self.current = None
+        self.next()
+
+    def abort(self):
+        jobs = self.drop()
+        if self.abortFunction:
+            self.abortFunction()
+        self.abort_jobs(jobs)
+
+    def clear(self):
+        self.abort_jobs(self.drop())
+
+    def drop(self):
+        jobs = ([self.current] if self.current else []) + list(self.queue)
+        self.dropped += sum(len(job['commands']) for job in jobs)
+        self.queue.clear()
+        self.idle.clear()
+        self.current = None
+        return jobs
+
+    def abort_jobs(self, jobs):
+        self.aborted = True
+        try:
+            for job in jobs:
+                for done in job['done']:
+                    done()
+        finally:
+            self.aborted = False
+
+    def depth(self):
+        return len(self.queue) + bool(self.current)
+
+    def report(self):
+        lines = ['MDI queue depth: {}  maximum: {}  coalesced: {}  dropped: {}'.format( \
+                 self.depth(), self.maxDepth, self.coalesced, self.dropped)]
+        for priority, name in self.names.items():
+            waits = sorted(wait for command, p, wait, run in self.latency if p == priority)
+            if waits:
+                lines.append('{} wait ms  mean: {:0.1f}  max: {:0.1f}'.format( \
+                             name, sum(waits) * 1000 / len(waits), waits[-1] * 1000))
+        lines.append('{:<32}{:>8}{:>10}{:>10}'.format('command', 'class', 'wait ms', 'run ms'))
+        for command, priority, wait, run in self.latency:
+            lines.append('{:<32}{:>8}{:>10.1f}{:>10.1f}'.format(command[:31], self.names[priority], wait * 1000, run * 1000))
+        return '\n'.join(lines)
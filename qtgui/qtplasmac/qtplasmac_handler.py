@@ -25,14 +25,20 @@ import os
 import sys
 from shutil import copy as COPY
 from shutil import move as MOVE
+from shutil import copymode as COPYMODE
 from subprocess import Popen, PIPE
 from subprocess import run as RUN
-from subprocess import call as CALL
-from importlib import reload
+from importlib import reload, import_module
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import time
-import tarfile
 import math
 import glob
+import stat
+import re
+import json
+import hashlib
+import inspect
 import linuxcnc
 import hal
 from OpenGL.GL import glTranslatef
@@ -62,9 +68,11 @@ from qtvcp.widgets.simple_widgets import DoubleScale as DOUBLESCALE
 from qtvcp.widgets.status_label import StatusLabel as STATLABEL
 from qtvcp.widgets.stylesheeteditor import  StyleSheetEditor as SSE
 from qtvcp.lib.aux_program_loader import Aux_program_loader
-from plasmac import run_from_line as RFL
 from rs274.glcanon import GlCanonDraw
 from qt5_graphics import Lcnc_3dGraphics as DRO
+from callback_timer import CallbackTimer, cycle_time
+from mdi_queue import MdiQueue
+from ini_model import ini_model
 
 LOG = logger.getLogger(__name__)
 KEYBIND = Keylookup()
@@ -74,6 +82,9 @@ ACTION = Action()
 TOOL = Tool()
 AUX_PRGM = Aux_program_loader()
 INIPATH = os.environ.get('INI_FILE_NAME', '/dev/null')
+# temporary files and reports, and the persistent caches, can be moved for benchmarks and tests
+TMPPATH = os.environ.get('QTPLASMAC_TMPDIR', '/tmp/qtplasmac')
+CACHEPATH = os.environ.get('QTPLASMAC_CACHEDIR', os.path.join(os.path.expanduser('~'), '.cache', 'qtplasmac'))
 
 _translate = QCoreApplication.translate
 
@@ -87,6 +98,349 @@ class VLine(QFrame):
 class ColorError(Exception):
     pass
 
+# import a module on first use rather than when the handler is loaded
+# the import times are written to import_times.txt in the temporary directory
+class DeferredImport:
+    loadTimes = {}
+    reportFile = os.path.join(TMPPATH, 'import_times.txt')
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, item):
+        if item.startswith('__'):
+            raise AttributeError(item)
+        return getattr(self.load(), item)
+
+    def load(self):
+        if self._module is None:
+            startTime = time.time()
+            self._module = import_module(self._name)
+            DeferredImport.loadTimes[self._name] = time.time() - startTime
+            DeferredImport.write_report()
+        return self._module
+
+    def reload(self):
+        self._module = reload(self.load())
+        return self._module
+
+    @classmethod
+    def write_report(cls):
+        try:
+            if not os.path.isdir(os.path.dirname(cls.reportFile)):
+                os.makedirs(os.path.dirname(cls.reportFile))
+            with open(cls.reportFile, 'w') as outFile:
+                outFile.write('import time: cumulative [us] | imported package\n')
+                for name, seconds in sorted(cls.loadTimes.items(), key=lambda item: item[1], reverse=True):
+                    outFile.write('import time: {:>15} | {}\n'.format(int(seconds * 1000000), name))
+        except:
+            LOG.debug('Cannot write import report to {}'.format(cls.reportFile))
+
+# record how long each startup phase takes
+class StartupTimeline:
+    reportFile = os.path.join(TMPPATH, 'startup_timeline.json')
+    target = 5.0
+
+    def __init__(self):
+        self.origin = time.time()
+        self.stage = None
+        self.stageStart = self.origin
+        self.phases = []
+        self.stages = []
+
+    def begin(self, stage):
+        self.stage = stage
+        self.stageStart = time.time()
+
+    def end(self):
+        self.stages.append({'stage': self.stage, 'start': self.stageStart - self.origin, 'duration': time.time() - self.stageStart})
+
+    def run(self, function, *args):
+        stage = self.stage
+        startTime = time.time()
+        try:
+            return function(*args)
+        finally:
+            self.phases.append({'stage': stage, 'phase': function.__name__, \
+                                'start': startTime - self.origin, 'duration': time.time() - startTime})
+
+    def total(self):
+        return sum(stage['duration'] for stage in self.stages)
+
+    def write_report(self):
+        try:
+            if not os.path.isdir(os.path.dirname(self.reportFile)):
+                os.makedirs(os.path.dirname(self.reportFile))
+            with open(self.reportFile, 'w') as outFile:
+                json.dump({'total': self.total(), 'target': self.target, 'stages': self.stages, 'phases': self.phases}, outFile, indent=2)
+        except:
+            LOG.debug('Cannot write startup timeline to {}'.format(self.reportFile))
+
+# cache recolored images on disk so they are not rendered again on every start
+# the least recently used images are removed when the cache is full
+class PixmapCache:
+    def __init__(self, path, maxEntries=200):
+        self.path = path
+        self.maxEntries = maxEntries
+        self.pixmaps = {}
+
+    def key(self, imagePath, color, size):
+        mtime = os.path.getmtime(imagePath) if os.path.isfile(imagePath) else 0
+        text = '{}|{}|{}|{}x{}'.format(imagePath, mtime, QColor(color).name(QColor.HexArgb), size.width(), size.height())
+        return hashlib.sha1(text.encode()).hexdigest()
+
+    def get(self, imagePath, color):
+        size = QImageReader(imagePath).size()
+        key = self.key(imagePath, color, size)
+        if key in self.pixmaps:
+            return self.pixmaps[key]
+        cacheFile = os.path.join(self.path, '{}.png'.format(key))
+        pixmap = QPixmap()
+        if os.path.isfile(cacheFile) and pixmap.load(cacheFile, 'PNG'):
+            os.utime(cacheFile)
+        else:
+            pixmap = self.render(imagePath, color)
+            self.save(pixmap, cacheFile)
+        self.pixmaps[key] = pixmap
+        return pixmap
+
+    def render(self, imagePath, color):
+        pixmap = QPixmap(imagePath)
+        colorChange = QPainter(pixmap)
+        colorChange.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        colorChange.fillRect(pixmap.rect(), QColor(color))
+        colorChange.end()
+        return pixmap
+
+    def save(self, pixmap, cacheFile):
+        try:
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path)
+            pixmap.save(cacheFile, 'PNG')
+            files = glob.glob(os.path.join(self.path, '*.png'))
+            if len(files) > self.maxEntries:
+                files.sort(key=os.path.getmtime)
+                for file in files[:len(files) - self.maxEntries]:
+                    os.remove(file)
+        except:
+            LOG.debug('Cannot save {} to pixmap cache'.format(cacheFile))
+
+# a typed snapshot of the prefs file so reads come from memory
+# invalid entries are collected so they can be reported together
+# puts made within a transaction are written with a single atomic write
+class PrefsSnapshot:
+    def __init__(self, prefs, path):
+        self.prefs = prefs
+        self.path = path
+        self.raw = {}
+        self.values = {}
+        self.errors = []
+        self.staged = None
+        for section in prefs.sections():
+            self.raw[section] = dict(prefs.items(section, raw=True))
+
+    def __getattr__(self, item):
+        if item.startswith('__'):
+            raise AttributeError(item)
+        return getattr(self.prefs, item)
+
+    def convert(self, value, type):
+        if type == bool:
+            if value.lower() not in self.prefs.BOOLEAN_STATES:
+                raise ValueError(value)
+            return self.prefs.BOOLEAN_STATES[value.lower()]
+        return type(value)
+
+    def getpref(self, option, default=False, type=bool, section='DEFAULT'):
+        key = (section, option, type)
+        if key in self.values:
+            return self.values[key]
+        raw = self.raw.get(section, {}).get(self.prefs.optionxform(option))
+        if raw is None:
+            # missing entries are written to the file with their default value
+            value = self.prefs.getpref(option, default, type, section)
+            self.raw.setdefault(section, {})[self.prefs.optionxform(option)] = str(value)
+        else:
+            try:
+                value = self.convert(raw, type)
+            except:
+                self.errors.append((section, option, raw))
+                value = type(default)
+        self.values[key] = value
+        return value
+
+    def putpref(self, option, value, type=bool, section='DEFAULT'):
+        if self.staged is not None:
+            self.staged.append((section, option, str(type(value))))
+            return
+        self.prefs.putpref(option, value, type, section)
+        self.raw.setdefault(section, {})[self.prefs.optionxform(option)] = str(type(value))
+        self.forget(section, option)
+
+    # drop the cached values of an option for every type it was read as
+    def forget(self, section, option):
+        for key in [key for key in self.values if key[:2] == (section, option)]:
+            del self.values[key]
+
+    @contextmanager
+    def transaction(self):
+        if self.staged is not None:
+            yield self
+            return
+        self.staged = []
+        try:
+            yield self
+        except:
+            self.staged = None
+            raise
+        staged, self.staged = self.staged, None
+        self.commit(staged)
+
+    def commit(self, staged):
+        if not staged:
+            return
+        for section, option, value in staged:
+            if section != 'DEFAULT' and not self.prefs.has_section(section):
+                self.prefs.add_section(section)
+            self.prefs.set(section, option, value)
+            self.raw.setdefault(section, {})[self.prefs.optionxform(option)] = value
+            self.forget(section, option)
+        # write to a temporary file beside the real file then rename it over the real file
+        # so the prefs file is never left half written, a symlinked prefs file stays a symlink
+        path = os.path.realpath(self.path)
+        tmpFile = '{}.tmp'.format(path)
+        try:
+            with open(tmpFile, 'w') as outFile:
+                self.prefs.write(outFile)
+                outFile.flush()
+                os.fsync(outFile.fileno())
+            if os.path.exists(path):
+                COPYMODE(path, tmpFile)
+            os.replace(tmpFile, path)
+        except OSError:
+            if os.path.exists(tmpFile):
+                os.remove(tmpFile)
+            raise
+
+    def has_errors(self, section):
+        return bool([error for error in self.errors if error[0] == section])
+
+# watch for a serial port to appear, backing off exponentially between checks
+# the port is only probed once its device node exists
+class PortWatcher(QThread):
+    portFound = pyqtSignal(str)
+
+    def __init__(self, port, probe, minDelay=0.5, maxDelay=8.0):
+        super(PortWatcher, self).__init__()
+        self.port = port
+        self.probe = probe
+        self.minDelay = minDelay
+        self.maxDelay = maxDelay
+        self.paused = False
+
+    def run(self):
+        delay = self.minDelay
+        while not self.isInterruptionRequested():
+            if not self.paused and os.path.exists(self.port) and not self.probe(self.port):
+                self.portFound.emit(self.port)
+                return
+            for n in range(int(delay * 10)):
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(100)
+            delay = min(delay * 2, self.maxDelay)
+
+# run periodic work by priority class
+# critical work runs on every tick, cosmetic work runs every 'rate' ticks
+# the suspend hooks are called when the busy function changes state so
+# background work such as port watching can pause while the machine is busy
+class PeriodicScheduler:
+    CRITICAL = 0
+    COSMETIC = 1
+
+    def __init__(self, busy):
+        self.busy = busy
+        self.tasks = []
+        self.ticks = 0
+        self.suspended = False
+        self.suspendHooks = []
+
+    def add(self, function, priority=CRITICAL, rate=1):
+        self.tasks.append((priority, rate, function))
+
+    def tick(self):
+        busy = bool(self.busy())
+        if busy != self.suspended:
+            self.suspended = busy
+            for hook in self.suspendHooks:
+                hook(busy)
+        for priority, rate, function in self.tasks:
+            if self.ticks % rate:
+                continue
+            function()
+        self.ticks += 1
+
+# sample the watched hal pins once per periodic tick so all readers share one sample
+# a pin is watched from its first read, values are held in a list indexed by pin
+# only update_periodic consumers use it, callbacks that check limits or move the machine read pins live
+class HalSnapshot:
+    def __init__(self):
+        self.pins = []
+        self.index = {}
+        self.values = []
+
+    def refresh(self):
+        self.values[:] = [hal.get_value(pin) for pin in self.pins]
+
+    def get(self, pin):
+        if pin in self.index:
+            return self.values[self.index[pin]]
+        value = hal.get_value(pin)
+        self.index[pin] = len(self.pins)
+        self.pins.append(pin)
+        self.values.append(value)
+        return value
+
+    __getitem__ = get
+
+# only set the text of a widget if it differs from the current text
+# applied and skipped counts are kept so the saving can be measured
+class LabelUpdater:
+    def __init__(self):
+        self.applied = 0
+        self.skipped = 0
+
+    def set_text(self, widget, text):
+        if widget.text() == text:
+            self.skipped += 1
+        else:
+            widget.setText(text)
+            self.applied += 1
+
+# convex hull of a set of (x, y) points using the monotone chain algorithm
+# returns the hull vertices counter clockwise starting from the lowest x
+def convex_hull(points):
+    points = sorted(set(points))
+    if len(points) < 3:
+        return points
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    lower = []
+    for point in points:
+        while len(lower) > 1 and cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper = []
+    for point in reversed(points):
+        while len(upper) > 1 and cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return lower[:-1] + upper[:-1]
+
+TARFILE = DeferredImport('tarfile')
+RFL = DeferredImport('plasmac.run_from_line')
+
 # click signal for some labels
 def click_signal(widget):
     class Filter(QObject):
@@ -104,7 +458,7 @@ def click_signal(widget):
 
   # the main handler
 class HandlerClass:
-    from qtvcp.lib.qtplasmac import conversational as CONV
+    CONV = DeferredImport('qtvcp.lib.qtplasmac.conversational')
     # when self.w.button_frame changes size
     def eventFilter(self, object, event):
         if (event.type() == QtCore.QEvent.Resize):
@@ -112,12 +466,15 @@ class HandlerClass:
         return True
 
     def __init__(self, halcomp, widgets, paths):
+        self.timeline = StartupTimeline()
+        self.timeline.begin('__init__')
         self.firstRun = True
         self.h = halcomp
         self.w = widgets
         self.h.comp.setprefix('qtplasmac')
         self.PATHS = paths
         self.iniFile = INFO.INI
+        self.ini = ini_model(INIPATH)
         self.foreColor = '#ffee06'
         # ensure M190 exists in config directory
         if not os.path.isfile(os.path.join(self.PATHS.CONFIGPATH, 'M190')):
@@ -141,16 +498,31 @@ class HandlerClass:
         else:
             self.PREFS = None
         self.updateIni = []
-        self.update_check()
-        self.PREFS = Access(os.path.join(self.PATHS.CONFIGPATH, self.machineName + '.prefs'))
+        # the updates rewrite the prefs, INI and HAL files so they run on the gui thread
+        self.timeline.run(self.update_check)
+        prefsFile = os.path.join(self.PATHS.CONFIGPATH, self.machineName + '.prefs')
+        self.PREFS = PrefsSnapshot(Access(prefsFile), prefsFile)
+        # read only probes that don't touch widgets run in the background while the gui is built
+        # the powermax port probe can take seconds so it starts here and is collected in initialized__
+        self.workers = ThreadPoolExecutor(max_workers=2, thread_name_prefix='qtplasmac')
+        self.pmPort = self.PREFS.getpref('Port', '', str, 'POWERMAX') or None
+        if self.pmPort:
+            self.pmx485CheckJob = self.workers.submit(self.pmx485_port_error, self.pmPort)
         self.STYLEEDITOR = SSE(widgets, paths)
         self.GCODES = GCodes(widgets)
         self.IMAGES = os.path.join(self.PATHS.IMAGEDIR, 'qtplasmac/images/')
+        self.pixmapCache = PixmapCache(os.path.join(CACHEPATH, 'pixmaps'))
         self.landscape = True
         if os.path.basename(self.PATHS.XML) == 'qtplasmac_9x16.ui':
             self.landscape = False
         self.upFile = os.path.join(self.PATHS.CONFIGPATH, 'user_periodic.py')
+        self.upCode = None
+        self.upMtime = None
+        self.callbackTimer = CallbackTimer(cycle_time(self.ini), self.callback_overrun, \
+                                           reportFile=os.path.join(TMPPATH, 'callback_timing.txt'))
+        self.callbackTimer.add('user_periodic', 0.2)
         KEYBIND.add_call('Key_F12','on_keycall_F12')
+        KEYBIND.add_call('Key_F11','on_keycall_F11')
         KEYBIND.add_call('Key_F9','on_keycall_F9')
         KEYBIND.add_call('Key_Plus', 'on_keycall_PLUS')
         KEYBIND.add_call('Key_Minus', 'on_keycall_MINUS')
@@ -208,21 +580,26 @@ class HandlerClass:
         self.jogSyncList = []
         self.axisAList = ['dro_a', 'dro_label_a', 'home_a', 'touch_a', 'jog_a_plus', 'jog_a_minus']
         self.axisBList = ['dro_b', 'dro_label_b', 'home_b', 'touch_b', 'jog_b_plus', 'jog_b_minus']
-        self.xMin = float(self.iniFile.find('AXIS_X', 'MIN_LIMIT'))
-        self.xMax = float(self.iniFile.find('AXIS_X', 'MAX_LIMIT'))
-        self.yMin = float(self.iniFile.find('AXIS_Y', 'MIN_LIMIT'))
-        self.yMax = float(self.iniFile.find('AXIS_Y', 'MAX_LIMIT'))
-        self.zMin = float(self.iniFile.find('AXIS_Z', 'MIN_LIMIT'))
-        self.zMax = float(self.iniFile.find('AXIS_Z', 'MAX_LIMIT'))
+        axisX, axisY, axisZ = self.ini.axis('x'), self.ini.axis('y'), self.ini.axis('z')
+        self.xMin = axisX['min_limit']
+        self.xMax = axisX['max_limit']
+        self.yMin = axisY['min_limit']
+        self.yMax = axisY['max_limit']
+        self.zMin = axisZ['min_limit']
+        self.zMax = axisZ['max_limit']
         self.xLen = self.xMax - self.xMin
         self.yLen = self.yMax - self.yMin
-        self.thcFeedRate = float(self.iniFile.find('AXIS_Z', 'MAX_VELOCITY')) * \
-                           float(self.iniFile.find('AXIS_Z', 'OFFSET_AV_RATIO')) * 60
+        self.thcFeedRate = axisZ['max_velocity'] * axisZ['offset_av_ratio'] * 60
         self.maxHeight = self.zMax - self.zMin
         self.maxPidP = self.thcFeedRate / self.unitsPerMm * 0.1
-        self.tmpPath = '/tmp/qtplasmac/'
+        self.tmpPath = os.path.join(TMPPATH, '')
         if not os.path.isdir(self.tmpPath):
-            os.mkdir(self.tmpPath)
+            os.makedirs(self.tmpPath)
+        self.framePath = None
+        self.frameCache = {}
+        self.frameHull = []
+        self.frHull = False
+        self.frameCacheSize = 16
         self.materialFile = '{}_material.cfg'.format(self.machineName)
         self.tmpMaterialFile = '{}{}'.format(self.tmpPath, self.materialFile.replace('.cfg','.tmp'))
         self.tmpMaterialFileGCode = '{}{}'.format(self.tmpPath, self.materialFile.replace('.cfg','.gcode'))
@@ -238,6 +615,13 @@ class HandlerClass:
         self.pmx485FaultCode = 0.0
         self.pmx485ArcTime = 0.0
         self.pmx485LabelState = None
+        self.pmx485Watcher = None
+        self.scheduler = PeriodicScheduler(self.machine_busy)
+        self.halSnapshot = HalSnapshot()
+        self.mdiQueue = MdiQueue(STATUS, ACTION.CALL_MDI, abort=ACTION.ABORT)
+        self.moveTimeout = 120
+        self.labels = LabelUpdater()
+        self.flashText = {}
         self.currentX = self.currentY = 0
         self.degreeSymbol = u"\u00b0"
         self.cameraOn = False
@@ -248,6 +632,7 @@ class HandlerClass:
         self.filteredBkp = '{}filtered_bkp.ngc'.format(self.tmpPath)
         self.oldConvButton = False
         self.convWidgetsLoaded = False
+        self.tabsLoaded = []
         self.programPrefix = self.iniFile.find('DISPLAY', 'PROGRAM_PREFIX') or os.environ['LINUXCNC_NCFILES_DIR']
         self.dialogError = False
         self.cutTypeText = ''
@@ -263,6 +648,7 @@ class HandlerClass:
         self.ovButton, self.llButton, self.tlButton = '', '', ''
         self.halTogglePins = {}
         self.halPulsePins = {}
+        self.buttonStyles = {}
         self.torchOn = False
         self.progRun = False
         self.rapidOn = False
@@ -307,33 +693,35 @@ class HandlerClass:
         self.CUT_REC_ON     = 25
         self.CUT_REC_OFF    = 26
         self.DEBUG          = 27
+        self.timeline.end()
 
 # called by qtvcp.py
     def initialized__(self):
+        self.timeline.begin('initialized__')
         # ensure we get all startup errors
         STATUS.connect('error', self.error_update)
         STATUS.connect('graphics-gcode-error', lambda o, e:self.error_update(o, linuxcnc.OPERATOR_ERROR, e))
         STATUS.emit('update-machine-log', '--- {} - QtPlasmaC v{}, powered by QtVCP on LinuxCNC v{} ---'.format(self.machineName, VERSION, linuxcnc.version.split(':')[0]), None)
-        self.make_hal_pins()
-        self.init_preferences()
-        self.hide_widgets()
-        self.init_widgets()
+        self.timeline.run(self.make_hal_pins)
+        self.timeline.run(self.init_preferences)
+        self.timeline.run(self.hide_widgets)
+        self.timeline.run(self.init_widgets)
         # hijack the qtvcp shutdown to our own close event
         self.w.screen_options.QTVCP_INSTANCE_.closeEvent = self.closeEvent
         self.w.button_frame.installEventFilter(self.w)
-        self.link_hal_pins()
-        self.statistics_init()
-        self.set_axes_and_joints()
-        self.set_spinbox_parameters()
-        self.load_plasma_parameters()
-        self.set_mode()
-        self.user_button_setup()
-        self.set_buttons_state([self.estopOnList], True)
-        self.check_material_file()
-        self.load_materials()
-        self.offset_peripherals()
-        self.set_probe_offset_pins()
-        self.wcs_rotation('get')
+        self.timeline.run(self.link_hal_pins)
+        self.timeline.run(self.statistics_init)
+        self.timeline.run(self.set_axes_and_joints)
+        self.timeline.run(self.set_spinbox_parameters)
+        self.timeline.run(self.load_plasma_parameters)
+        self.timeline.run(self.set_mode)
+        self.timeline.run(self.user_button_setup)
+        self.timeline.run(self.set_buttons_state, [self.estopOnList], True)
+        self.timeline.run(self.check_material_file)
+        self.timeline.run(self.load_materials)
+        self.timeline.run(self.offset_peripherals)
+        self.timeline.run(self.set_probe_offset_pins)
+        self.timeline.run(self.wcs_rotation, 'get')
         STATUS.connect('state-estop', lambda w:self.estop_state(True))
         STATUS.connect('state-estop-reset', lambda w:self.estop_state(False))
         STATUS.connect('state-on', lambda w:self.power_state(True))
@@ -349,7 +737,7 @@ class HandlerClass:
         STATUS.connect('g-code-changed', self.gcodes_changed)
         STATUS.connect('m-code-changed', self.mcodes_changed)
         STATUS.connect('program-pause-changed', self.pause_changed)
-        STATUS.connect('graphics-loading-progress', self.progress_changed)
+        STATUS.connect('graphics-loading-progress', self.callbackTimer.wrap('progress_changed', self.progress_changed))
         STATUS.connect('interp-paused', self.interp_paused)
         STATUS.connect('interp-idle', self.interp_idle)
         STATUS.connect('interp-reading', self.interp_reading)
@@ -359,7 +747,7 @@ class HandlerClass:
         STATUS.connect('graphics-gcode-properties', lambda w, d:self.update_gcode_properties(d))
         STATUS.connect('system_notify_button_pressed', self.system_notify_button_pressed)
         STATUS.connect('tool-in-spindle-changed', self.tool_changed)
-        STATUS.connect('periodic', lambda w: self.update_periodic())
+        STATUS.connect('periodic', self.callbackTimer.wrap('update_periodic', lambda w: self.update_periodic()))
         STATUS.connect('metric-mode-changed', self.metric_mode_changed)
         STATUS.connect('motion-type-changed', lambda w, data: self.motion_type_changed(data))
         self.startupTimer = QTimer()
@@ -374,17 +762,14 @@ class HandlerClass:
         self.ohmicLedTimer = QTimer()
         self.ohmicLedTimer.timeout.connect(self.ohmic_led_timeout)
         self.ohmicLedTimer.setSingleShot(True)
-        self.set_color_styles()
-        self.autorepeat_keys(False)
-        self.vm_check()
+        self.timeline.run(self.set_color_styles)
+        self.timeline.run(self.autorepeat_keys, False)
+        self.timeline.run(self.vm_check)
         # set hal pins only after initialized__ has begun
         # some locales won't set pins before this phase
         self.thcFeedRatePin.set(self.thcFeedRate)
-        self.pmPort = None
-        if self.PREFS.getpref('Port', '', str, 'POWERMAX'):
-            self.pmPort = self.PREFS.getpref('Port', '', str, 'POWERMAX')
-        if self.pmPort and self.pmx485_check(self.pmPort):
-            self.pmx485_startup(self.pmPort)
+        if self.pmPort and self.timeline.run(self.pmx485_check, self.pmPort, False, self.pmx485CheckJob.result()):
+            self.timeline.run(self.pmx485_startup, self.pmPort)
         else:
             self.w.gas_pressure.hide()
             self.w.gas_pressure_label.hide()
@@ -398,16 +783,34 @@ class HandlerClass:
             self.mdiLast = None
         self.w.mdihistory.MDILine.spindle_inhibit(True)
         if self.updateIni:
-            self.update_iniwrite()
+            self.timeline.run(self.update_iniwrite)
+        self.prefs_error_report()
         self.startupTimer.start(250)
+        self.timeline.end()
 
 # called by qtvcp.py, can override qtvcp settings or qtvcp allowed user options (via INI)
     def before_loop__(self):
+        self.timeline.begin('before_loop__')
         self.w.setWindowTitle('{} - QtPlasmaC v{}, powered by QtVCP on LinuxCNC v{}'.format(self.machineName, VERSION, linuxcnc.version.split(':')[0]))
         self.iconPath = 'share/icons/hicolor/scalable/apps/linuxcnc_alt/linuxcncicon_plasma.svg'
         appPath = os.path.realpath(os.path.dirname(sys.argv[0]))
         self.iconBase = '/usr' if appPath == '/usr/bin' else appPath.replace('/bin', '/debian/extras/usr')
         self.w.setWindowIcon(QIcon(os.path.join(self.iconBase, self.iconPath)))
+        self.timeline.end()
+        self.startup_timeline_report()
+
+    def startup_timeline_report(self):
+        log = _translate('HandlerClass', 'Startup time')
+        text = '{}: {:0.3f} s'.format(log, self.timeline.total())
+        for stage in self.timeline.stages:
+            text += '\n  {}: {:0.3f} s'.format(stage['stage'], stage['duration'])
+            for phase in [p for p in self.timeline.phases if p['stage'] == stage['stage']]:
+                text += '\n    {}: {:0.3f} s'.format(phase['phase'], phase['duration'])
+        STATUS.emit('update-machine-log', text, 'TIME')
+        if self.timeline.total() > self.timeline.target:
+            log = _translate('HandlerClass', 'Startup exceeded target of')
+            STATUS.emit('update-machine-log', '{} {:0.1f} s'.format(log, self.timeline.target), 'TIME')
+        self.timeline.write_report()
 
 
 #########################################################################################################################
@@ -415,11 +818,13 @@ class HandlerClass:
 #########################################################################################################################
 # called by qtvcp.py
     def class_patch__(self):
-        self.gcode_editor_patch()
-        self.camview_patch()
-        self.offset_table_patch()
-        self.qt5_graphics_patch()
-        self.screen_options_patch()
+        self.timeline.begin('class_patch__')
+        self.timeline.run(self.gcode_editor_patch)
+        self.timeline.run(self.camview_patch)
+        self.timeline.run(self.offset_table_patch)
+        self.timeline.run(self.qt5_graphics_patch)
+        self.timeline.run(self.screen_options_patch)
+        self.timeline.end()
 
 # patched gcode editor functions
     def gcode_editor_patch(self):
@@ -754,107 +1159,143 @@ class HandlerClass:
         self.zOffsetPin = self.h.newpin('z_offset_counts', hal.HAL_S32, hal.HAL_IN)
 
     def link_hal_pins(self):
-        #arc parameters
-        CALL(['halcmd', 'net', 'plasmac:arc-fail-delay', 'qtplasmac.arc_fail_delay-f', 'plasmac.arc-fail-delay'])
-        CALL(['halcmd', 'net', 'plasmac:arc-max-starts', 'qtplasmac.arc_max_starts-s', 'plasmac.arc-max-starts'])
-        CALL(['halcmd', 'net', 'plasmac:restart-delay', 'qtplasmac.arc_restart_delay-f', 'plasmac.restart-delay'])
-        CALL(['halcmd', 'net', 'plasmac:arc-voltage-scale', 'qtplasmac.arc_voltage_scale-f', 'plasmac.arc-voltage-scale'])
-        CALL(['halcmd', 'net', 'plasmac:arc-voltage-offset', 'qtplasmac.arc_voltage_offset-f', 'plasmac.arc-voltage-offset'])
-        CALL(['halcmd', 'net', 'plasmac:height-per-volt', 'qtplasmac.height_per_volt-f', 'plasmac.height-per-volt'])
-        CALL(['halcmd', 'net', 'plasmac:arc-ok-high', 'qtplasmac.arc_ok_high-f', 'plasmac.arc-ok-high'])
-        CALL(['halcmd', 'net', 'plasmac:arc-ok-low', 'qtplasmac.arc_ok_low-f', 'plasmac.arc-ok-low'])
-        #thc parameters
-        CALL(['halcmd', 'net', 'plasmac:thc-feed-rate', 'qtplasmac.thc_feed_rate', 'plasmac.thc-feed-rate'])
-        CALL(['halcmd', 'net', 'plasmac:thc-auto', 'qtplasmac.thc_auto', 'plasmac.thc-auto'])
-        CALL(['halcmd', 'net', 'plasmac:thc-delay', 'qtplasmac.thc_delay-f', 'plasmac.thc-delay'])
-        CALL(['halcmd', 'net', 'plasmac:thc-sample-counts', 'qtplasmac.thc_sample_counts-s', 'plasmac.thc-sample-counts'])
-        CALL(['halcmd', 'net', 'plasmac:thc-sample-threshold', 'qtplasmac.thc_sample_threshold-f', 'plasmac.thc-sample-threshold'])
-        CALL(['halcmd', 'net', 'plasmac:thc-threshold', 'qtplasmac.thc_threshold-f', 'plasmac.thc-threshold'])
-        CALL(['halcmd', 'net', 'plasmac:pid-p-gain', 'qtplasmac.pid_p_gain-f', 'plasmac.pid-p-gain'])
-        CALL(['halcmd', 'net', 'plasmac:pid-i-gain', 'qtplasmac.pid_i_gain-f', 'plasmac.pid-i-gain'])
-        CALL(['halcmd', 'net', 'plasmac:pid-d-gain', 'qtplasmac.pid_d_gain-f', 'plasmac.pid-d-gain'])
-        CALL(['halcmd', 'net', 'plasmac:cornerlock-threshold', 'qtplasmac.cornerlock_threshold-f', 'plasmac.cornerlock-threshold'])
-        CALL(['halcmd', 'net', 'plasmac:voidlock-slope', 'qtplasmac.voidlock_slope-s', 'plasmac.voidlock-slope'])
-        #probe parameters
-        CALL(['halcmd', 'net', 'plasmac:float-switch-travel', 'qtplasmac.float_switch_travel-f', 'plasmac.float-switch-travel'])
-        CALL(['halcmd', 'net', 'plasmac:probe-feed-rate', 'qtplasmac.probe_feed_rate-f', 'plasmac.probe-feed-rate'])
-        CALL(['halcmd', 'net', 'plasmac:probe-start-height', 'qtplasmac.probe_start_height-f', 'plasmac.probe-start-height'])
-        CALL(['halcmd', 'net', 'plasmac:ohmic-probe-offset', 'qtplasmac.ohmic_probe_offset-f', 'plasmac.ohmic-probe-offset'])
-        CALL(['halcmd', 'net', 'plasmac:ohmic-max-attempts', 'qtplasmac.ohmic_max_attempts-s', 'plasmac.ohmic-max-attempts'])
-        CALL(['halcmd', 'net', 'plasmac:skip-ihs-distance', 'qtplasmac.skip_ihs_distance-f', 'plasmac.skip-ihs-distance'])
-        #safety parameters
-        CALL(['halcmd', 'net', 'plasmac:safe-height', 'qtplasmac.safe_height-f', 'plasmac.safe-height'])
-        #scribe parameters
-        CALL(['halcmd', 'net', 'plasmac:scribe-arm-delay', 'qtplasmac.scribe_arm_delay-f', 'plasmac.scribe-arm-delay'])
-        CALL(['halcmd', 'net', 'plasmac:scribe-on-delay', 'qtplasmac.scribe_on_delay-f', 'plasmac.scribe-on-delay'])
-        #spotting parameters
-        CALL(['halcmd', 'net', 'plasmac:spotting-threshold', 'qtplasmac.spotting_threshold-f', 'plasmac.spotting-threshold'])
-        CALL(['halcmd', 'net', 'plasmac:spotting-time', 'qtplasmac.spotting_time-f', 'plasmac.spotting-time'])
-        #motion parameters
-        CALL(['halcmd', 'net', 'plasmac:setup-feed-rate', 'qtplasmac.setup_feed_rate-f', 'plasmac.setup-feed-rate'])
-        #material parameters
-        CALL(['halcmd', 'net', 'plasmac:cut-feed-rate', 'qtplasmac.cut_feed_rate-f', 'plasmac.cut-feed-rate'])
-        CALL(['halcmd', 'net', 'plasmac:cut-height', 'qtplasmac.cut_height-f', 'plasmac.cut-height'])
-        CALL(['halcmd', 'net', 'plasmac:cut-volts', 'qtplasmac.cut_volts-f', 'plasmac.cut-volts'])
-        CALL(['halcmd', 'net', 'plasmac:kerf-width', 'qtplasmac.kerf_width-f', 'plasmac.kerf-width'])
-        CALL(['halcmd', 'net', 'plasmac:pause-at-end', 'qtplasmac.pause_at_end-f', 'plasmac.pause-at-end'])
-        CALL(['halcmd', 'net', 'plasmac:pierce-delay', 'qtplasmac.pierce_delay-f', 'plasmac.pierce-delay'])
-        CALL(['halcmd', 'net', 'plasmac:pierce-height', 'qtplasmac.pierce_height-f', 'plasmac.pierce-height'])
-        CALL(['halcmd', 'net', 'plasmac:puddle-jump-delay', 'qtplasmac.puddle_jump_delay-f', 'plasmac.puddle-jump-delay'])
-        CALL(['halcmd', 'net', 'plasmac:puddle-jump-height', 'qtplasmac.puddle_jump_height-f', 'plasmac.puddle-jump-height'])
-        #monitor
-        CALL(['halcmd', 'net', 'plasmac:arc_ok_out', 'plasmac.arc-ok-out', 'qtplasmac.led_arc_ok'])
-        CALL(['halcmd', 'net', 'plasmac:arc_voltage_out', 'plasmac.arc-voltage-out', 'qtplasmac.arc_voltage'])
-        CALL(['halcmd', 'net', 'plasmac:breakaway-switch-out', 'qtplasmac.led_breakaway_switch'])
-        CALL(['halcmd', 'net', 'plasmac:cornerlock-is-locked', 'plasmac.cornerlock-is-locked', 'qtplasmac.led_corner_lock'])
-        CALL(['halcmd', 'net', 'plasmac:float-switch-out', 'qtplasmac.led_float_switch'])
-        CALL(['halcmd', 'net', 'plasmac:voidlock-is-locked', 'plasmac.voidlock-is-locked', 'qtplasmac.led_void_lock'])
-        CALL(['halcmd', 'net', 'plasmac:led-up', 'plasmac.led-up', 'qtplasmac.led_thc_up'])
-        CALL(['halcmd', 'net', 'plasmac:led-down', 'plasmac.led-down', 'qtplasmac.led_thc_down'])
-        CALL(['halcmd', 'net', 'plasmac:ohmic-probe-out', 'qtplasmac.ohmic_led_in'])
-        CALL(['halcmd', 'net', 'plasmac:thc-active', 'plasmac.thc-active', 'qtplasmac.led_thc_active'])
-        CALL(['halcmd', 'net', 'plasmac:thc-enabled', 'plasmac.thc-enabled', 'qtplasmac.led_thc_enabled'])
-        CALL(['halcmd', 'net', 'plasmac:torch-on', 'qtplasmac.led_torch_on'])
-        #control
-        CALL(['halcmd', 'net', 'plasmac:cornerlock-enable', 'qtplasmac.cornerlock_enable', 'plasmac.cornerlock-enable'])
-        CALL(['halcmd', 'net', 'plasmac:voidlock-enable', 'qtplasmac.voidlock_enable', 'plasmac.voidlock-enable'])
-        CALL(['halcmd', 'net', 'plasmac:mesh-enable', 'qtplasmac.mesh_enable', 'plasmac.mesh-enable'])
-        CALL(['halcmd', 'net', 'plasmac:ignore-arc-ok-1', 'qtplasmac.ignore_arc_ok', 'plasmac.ignore-arc-ok-1'])
-        CALL(['halcmd', 'net', 'plasmac:ohmic-probe-enable', 'qtplasmac.ohmic_probe_enable', 'plasmac.ohmic-probe-enable'])
-        CALL(['halcmd', 'net', 'plasmac:thc-enable', 'qtplasmac.thc_enable', 'plasmac.thc-enable'])
-        CALL(['halcmd', 'net', 'plasmac:use-auto-volts', 'qtplasmac.use_auto_volts', 'plasmac.use-auto-volts'])
-        CALL(['halcmd', 'net', 'plasmac:torch-enable', 'qtplasmac.torch_enable', 'plasmac.torch-enable'])
-        #offsets
-        CALL(['halcmd', 'net', 'plasmac:x-offset-current', 'qtplasmac.x_offset'])
-        CALL(['halcmd', 'net', 'plasmac:y-offset-current', 'qtplasmac.y_offset'])
-        CALL(['halcmd', 'net', 'plasmac:offsets-active', 'qtplasmac.offsets_active'])
-        #override
-        CALL(['halcmd', 'net', 'plasmac:height-override','qtplasmac.height_override','plasmac.height-override'])
-        #INI
-        CALL(['halcmd', 'net', 'plasmac:axis-x-max-limit', 'ini.x.max_limit', 'plasmac.axis-x-max-limit'])
-        CALL(['halcmd', 'net', 'plasmac:axis-x-min-limit', 'ini.x.min_limit', 'plasmac.axis-x-min-limit'])
-        CALL(['halcmd', 'net', 'plasmac:axis-y-max-limit', 'ini.y.max_limit', 'plasmac.axis-y-max-limit'])
-        CALL(['halcmd', 'net', 'plasmac:axis-y-min-limit', 'ini.y.min_limit', 'plasmac.axis-y-min-limit'])
-        CALL(['halcmd', 'net', 'plasmac:axis-z-max-limit', 'ini.z.max_limit', 'plasmac.axis-z-max-limit'])
-        CALL(['halcmd', 'net', 'plasmac:axis-z-min-limit', 'ini.z.min_limit', 'plasmac.axis-z-min-limit'])
-        # misc
-        CALL(['halcmd', 'net', 'plasmac:consumable-changing', 'plasmac.consumable-changing', 'qtplasmac.consumable_changing'])
-        CALL(['halcmd', 'net', 'plasmac:gcode-scale', 'plasmac.gcode-scale', 'qtplasmac.gcode_scale'])
-        CALL(['halcmd', 'net', 'plasmac:jog-inhibit', 'qtplasmac.jog_inhibited'])
-        CALL(['halcmd', 'net', 'plasmac:laser-on', 'qtplasmac.laser_on'])
-        CALL(['halcmd', 'net', 'plasmac:laser-recovery-state', 'plasmac.laser-recovery-state', 'qtplasmac.laser_recovery_state'])
-        CALL(['halcmd', 'net', 'plasmac:probe-test-error', 'plasmac.probe-test-error', 'qtplasmac.probe_test_error'])
-        CALL(['halcmd', 'net', 'plasmac:sensor_active', 'plasmac.sensor-active', 'qtplasmac.sensor_active'])
-        CALL(['halcmd', 'net', 'plasmac:state', 'plasmac.state-out', 'qtplasmac.plasmac_state'])
-        CALL(['halcmd', 'net', 'plasmac:z-height', 'plasmac.z-height', 'qtplasmac.z_height'])
-        CALL(['halcmd', 'net', 'plasmac:z-offset-counts', 'qtplasmac.z_offset_counts'])
-        CALL(['halcmd', 'net', 'plasmac:offset-set-probe', 'plasmac.offset-set-probe', 'qtplasmac.offset_set_probe'])
-        CALL(['halcmd', 'net', 'plasmac:offset-set-scribe', 'plasmac.offset-set-scribe', 'qtplasmac.offset_set_scribe'])
-
+        nets = [
+            #arc parameters
+            ('plasmac:arc-fail-delay', 'qtplasmac.arc_fail_delay-f', 'plasmac.arc-fail-delay'),
+            ('plasmac:arc-max-starts', 'qtplasmac.arc_max_starts-s', 'plasmac.arc-max-starts'),
+            ('plasmac:restart-delay', 'qtplasmac.arc_restart_delay-f', 'plasmac.restart-delay'),
+            ('plasmac:arc-voltage-scale', 'qtplasmac.arc_voltage_scale-f', 'plasmac.arc-voltage-scale'),
+            ('plasmac:arc-voltage-offset', 'qtplasmac.arc_voltage_offset-f', 'plasmac.arc-voltage-offset'),
+            ('plasmac:height-per-volt', 'qtplasmac.height_per_volt-f', 'plasmac.height-per-volt'),
+            ('plasmac:arc-ok-high', 'qtplasmac.arc_ok_high-f', 'plasmac.arc-ok-high'),
+            ('plasmac:arc-ok-low', 'qtplasmac.arc_ok_low-f', 'plasmac.arc-ok-low'),
+            #thc parameters
+            ('plasmac:thc-feed-rate', 'qtplasmac.thc_feed_rate', 'plasmac.thc-feed-rate'),
+            ('plasmac:thc-auto', 'qtplasmac.thc_auto', 'plasmac.thc-auto'),
+            ('plasmac:thc-delay', 'qtplasmac.thc_delay-f', 'plasmac.thc-delay'),
+            ('plasmac:thc-sample-counts', 'qtplasmac.thc_sample_counts-s', 'plasmac.thc-sample-counts'),
+            ('plasmac:thc-sample-threshold', 'qtplasmac.thc_sample_threshold-f', 'plasmac.thc-sample-threshold'),
+            ('plasmac:thc-threshold', 'qtplasmac.thc_threshold-f', 'plasmac.thc-threshold'),
+            ('plasmac:pid-p-gain', 'qtplasmac.pid_p_gain-f', 'plasmac.pid-p-gain'),
+            ('plasmac:pid-i-gain', 'qtplasmac.pid_i_gain-f', 'plasmac.pid-i-gain'),
+            ('plasmac:pid-d-gain', 'qtplasmac.pid_d_gain-f', 'plasmac.pid-d-gain'),
+            ('plasmac:cornerlock-threshold', 'qtplasmac.cornerlock_threshold-f', 'plasmac.cornerlock-threshold'),
+            ('plasmac:voidlock-slope', 'qtplasmac.voidlock_slope-s', 'plasmac.voidlock-slope'),
+            #probe parameters
+            ('plasmac:float-switch-travel', 'qtplasmac.float_switch_travel-f', 'plasmac.float-switch-travel'),
+            ('plasmac:probe-feed-rate', 'qtplasmac.probe_feed_rate-f', 'plasmac.probe-feed-rate'),
+            ('plasmac:probe-start-height', 'qtplasmac.probe_start_height-f', 'plasmac.probe-start-height'),
+            ('plasmac:ohmic-probe-offset', 'qtplasmac.ohmic_probe_offset-f', 'plasmac.ohmic-probe-offset'),
+            ('plasmac:ohmic-max-attempts', 'qtplasmac.ohmic_max_attempts-s', 'plasmac.ohmic-max-attempts'),
+            ('plasmac:skip-ihs-distance', 'qtplasmac.skip_ihs_distance-f', 'plasmac.skip-ihs-distance'),
+            #safety parameters
+            ('plasmac:safe-height', 'qtplasmac.safe_height-f', 'plasmac.safe-height'),
+            #scribe parameters
+            ('plasmac:scribe-arm-delay', 'qtplasmac.scribe_arm_delay-f', 'plasmac.scribe-arm-delay'),
+            ('plasmac:scribe-on-delay', 'qtplasmac.scribe_on_delay-f', 'plasmac.scribe-on-delay'),
+            #spotting parameters
+            ('plasmac:spotting-threshold', 'qtplasmac.spotting_threshold-f', 'plasmac.spotting-threshold'),
+            ('plasmac:spotting-time', 'qtplasmac.spotting_time-f', 'plasmac.spotting-time'),
+            #motion parameters
+            ('plasmac:setup-feed-rate', 'qtplasmac.setup_feed_rate-f', 'plasmac.setup-feed-rate'),
+            #material parameters
+            ('plasmac:cut-feed-rate', 'qtplasmac.cut_feed_rate-f', 'plasmac.cut-feed-rate'),
+            ('plasmac:cut-height', 'qtplasmac.cut_height-f', 'plasmac.cut-height'),
+            ('plasmac:cut-volts', 'qtplasmac.cut_volts-f', 'plasmac.cut-volts'),
+            ('plasmac:kerf-width', 'qtplasmac.kerf_width-f', 'plasmac.kerf-width'),
+            ('plasmac:pause-at-end', 'qtplasmac.pause_at_end-f', 'plasmac.pause-at-end'),
+            ('plasmac:pierce-delay', 'qtplasmac.pierce_delay-f', 'plasmac.pierce-delay'),
+            ('plasmac:pierce-height', 'qtplasmac.pierce_height-f', 'plasmac.pierce-height'),
+            ('plasmac:puddle-jump-delay', 'qtplasmac.puddle_jump_delay-f', 'plasmac.puddle-jump-delay'),
+            ('plasmac:puddle-jump-height', 'qtplasmac.puddle_jump_height-f', 'plasmac.puddle-jump-height'),
+            #monitor
+            ('plasmac:arc_ok_out', 'plasmac.arc-ok-out', 'qtplasmac.led_arc_ok'),
+            ('plasmac:arc_voltage_out', 'plasmac.arc-voltage-out', 'qtplasmac.arc_voltage'),
+            ('plasmac:breakaway-switch-out', 'qtplasmac.led_breakaway_switch'),
+            ('plasmac:cornerlock-is-locked', 'plasmac.cornerlock-is-locked', 'qtplasmac.led_corner_lock'),
+            ('plasmac:float-switch-out', 'qtplasmac.led_float_switch'),
+            ('plasmac:voidlock-is-locked', 'plasmac.voidlock-is-locked', 'qtplasmac.led_void_lock'),
+            ('plasmac:led-up', 'plasmac.led-up', 'qtplasmac.led_thc_up'),
+            ('plasmac:led-down', 'plasmac.led-down', 'qtplasmac.led_thc_down'),
+            ('plasmac:ohmic-probe-out', 'qtplasmac.ohmic_led_in'),
+            ('plasmac:thc-active', 'plasmac.thc-active', 'qtplasmac.led_thc_active'),
+            ('plasmac:thc-enabled', 'plasmac.thc-enabled', 'qtplasmac.led_thc_enabled'),
+            ('plasmac:torch-on', 'qtplasmac.led_torch_on'),
+            #control
+            ('plasmac:cornerlock-enable', 'qtplasmac.cornerlock_enable', 'plasmac.cornerlock-enable'),
+            ('plasmac:voidlock-enable', 'qtplasmac.voidlock_enable', 'plasmac.voidlock-enable'),
+            ('plasmac:mesh-enable', 'qtplasmac.mesh_enable', 'plasmac.mesh-enable'),
+            ('plasmac:ignore-arc-ok-1', 'qtplasmac.ignore_arc_ok', 'plasmac.ignore-arc-ok-1'),
+            ('plasmac:ohmic-probe-enable', 'qtplasmac.ohmic_probe_enable', 'plasmac.ohmic-probe-enable'),
+            ('plasmac:thc-enable', 'qtplasmac.thc_enable', 'plasmac.thc-enable'),
+            ('plasmac:use-auto-volts', 'qtplasmac.use_auto_volts', 'plasmac.use-auto-volts'),
+            ('plasmac:torch-enable', 'qtplasmac.torch_enable', 'plasmac.torch-enable'),
+            #offsets
+            ('plasmac:x-offset-current', 'qtplasmac.x_offset'),
+            ('plasmac:y-offset-current', 'qtplasmac.y_offset'),
+            ('plasmac:offsets-active', 'qtplasmac.offsets_active'),
+            #override
+            ('plasmac:height-override', 'qtplasmac.height_override', 'plasmac.height-override'),
+            #INI
+            ('plasmac:axis-x-max-limit', 'ini.x.max_limit', 'plasmac.axis-x-max-limit'),
+            ('plasmac:axis-x-min-limit', 'ini.x.min_limit', 'plasmac.axis-x-min-limit'),
+            ('plasmac:axis-y-max-limit', 'ini.y.max_limit', 'plasmac.axis-y-max-limit'),
+            ('plasmac:axis-y-min-limit', 'ini.y.min_limit', 'plasmac.axis-y-min-limit'),
+            ('plasmac:axis-z-max-limit', 'ini.z.max_limit', 'plasmac.axis-z-max-limit'),
+            ('plasmac:axis-z-min-limit', 'ini.z.min_limit', 'plasmac.axis-z-min-limit'),
+            # misc
+            ('plasmac:consumable-changing', 'plasmac.consumable-changing', 'qtplasmac.consumable_changing'),
+            ('plasmac:gcode-scale', 'plasmac.gcode-scale', 'qtplasmac.gcode_scale'),
+            ('plasmac:jog-inhibit', 'qtplasmac.jog_inhibited'),
+            ('plasmac:laser-on', 'qtplasmac.laser_on'),
+            ('plasmac:laser-recovery-state', 'plasmac.laser-recovery-state', 'qtplasmac.laser_recovery_state'),
+            ('plasmac:probe-test-error', 'plasmac.probe-test-error', 'qtplasmac.probe_test_error'),
+            ('plasmac:sensor_active', 'plasmac.sensor-active', 'qtplasmac.sensor_active'),
+            ('plasmac:state', 'plasmac.state-out', 'qtplasmac.plasmac_state'),
+            ('plasmac:z-height', 'plasmac.z-height', 'qtplasmac.z_height'),
+            ('plasmac:z-offset-counts', 'qtplasmac.z_offset_counts'),
+            ('plasmac:offset-set-probe', 'plasmac.offset-set-probe', 'qtplasmac.offset_set_probe'),
+            ('plasmac:offset-set-scribe', 'plasmac.offset-set-scribe', 'qtplasmac.offset_set_scribe'),
+                ]
 # *** add system hal pin changes here that may affect existing configs ***
 # *** these may be removed after auto updating is implemented          ***
         if not hal.pin_has_writer('plasmac.feed-upm'): # if feed-upm is not yet connected in hal
-            CALL(['halcmd', 'net', 'plasmac:feed-upm', 'motion.feed-upm', 'plasmac.feed-upm'])
+            nets.append(('plasmac:feed-upm', 'motion.feed-upm', 'plasmac.feed-upm'))
+        self.link_hal_nets(nets)
+
+    def link_hal_nets(self, nets):
+        # link all nets with a single halcmd instance reading a script from stdin
+        # -k keeps halcmd going after a failed net so every error can be reported
+        startTime = time.time()
+        script = ''.join('net {}\n'.format(' '.join(net)) for net in nets)
+        try:
+            proc = Popen(['halcmd', '-k', '-f'], stdin=PIPE, stdout=PIPE, stderr=PIPE)
+            errors = proc.communicate(script.encode())[1].decode('utf-8', 'replace')
+        except Exception as err:
+            head = _translate('HandlerClass', 'HAL Error')
+            msg0 = _translate('HandlerClass', 'Cannot run halcmd to link nets')
+            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}\n{}\n'.format(head, msg0, err))
+            return
+        # halcmd prefixes each error with the script line number
+        failed = []
+        for line in errors.splitlines():
+            match = re.search(r':(\d+):\s*(.*)', line)
+            if match and 0 < int(match.group(1)) <= len(nets):
+                failed.append('{}: {}'.format(nets[int(match.group(1)) - 1][0], match.group(2)))
+            elif line.strip():
+                failed.append(line.strip())
+        # a failure that halcmd did not report against a line
+        if proc.returncode and not failed:
+            head = _translate('HandlerClass', 'HAL Error')
+            msg0 = _translate('HandlerClass', 'halcmd failed while linking nets, exit status')
+            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{} {}\n'.format(head, msg0, proc.returncode))
+            return
+        if failed:
+            head = _translate('HandlerClass', 'HAL Error')
+            msg0 = _translate('HandlerClass', 'The following nets could not be linked')
+            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}:\n{}\n'.format(head, msg0, '\n'.join(failed)))
+        log = _translate('HandlerClass', 'HAL nets linked')
+        STATUS.emit('update-machine-log', '{} ({}/{}) in {:0.3f} s'.format(log, len(nets) - len(failed), len(nets), time.time() - startTime), 'TIME')
 
     def init_preferences(self):
         self.mode = self.PREFS.getpref('Mode', 0, int,'GUI_OPTIONS')
@@ -1002,8 +1443,10 @@ class HandlerClass:
         self.w.camview.cross_pointer_color = QtCore.Qt.red
         self.w.camview.font = QFont('arial,helvetica', 16)
         self.flashState = False
-        self.flashRate = 4
-        self.flasher = self.flashRate
+        self.flashRate = 5
+        self.scheduler.add(self.set_button_color, self.scheduler.COSMETIC, 2)
+        self.scheduler.add(self.flasher_toggle, self.scheduler.COSMETIC, self.flashRate)
+        self.scheduler.suspendHooks.append(self.pmx485_watch_suspend)
         self.manualCut = False
         self.jogPreManCut = [False, INFO.DEFAULT_LINEAR_JOG_VEL, 0]
         self.probeTest = False
@@ -1056,28 +1499,22 @@ class HandlerClass:
         self.probeOffsetX = 0.0
         self.probeOffsetY = 0.0
         self.probeDelay = 0.0
-        head = _translate('HandlerClass', 'Prefs File Error')
+        # invalid entries are reported by prefs_error_report
         # laser
-        try:
-            self.laserOffsetX = self.PREFS.getpref('X axis', 0, float, 'LASER_OFFSET')
-            self.laserOffsetY = self.PREFS.getpref('Y axis', 0, float, 'LASER_OFFSET')
-        except:
-            self.w.laser.hide()
-            msg0 = _translate('HandlerClass', 'Invalid entry for laser offset')
-            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}\n'.format(head, msg0))
+        self.laserOffsetX = self.PREFS.getpref('X axis', 0, float, 'LASER_OFFSET')
+        self.laserOffsetY = self.PREFS.getpref('Y axis', 0, float, 'LASER_OFFSET')
+        if self.PREFS.has_errors('LASER_OFFSET'):
+            self.laserOffsetX = self.laserOffsetY = 0.0
         if self.laserOffsetX or self.laserOffsetY:
             self.idleHomedList.append('laser')
             self.w.laser.setEnabled(False)
         else:
             self.w.laser.hide()
         # camera
-        try:
-            self.camOffsetX = self.PREFS.getpref('X axis', 0, float, 'CAMERA_OFFSET')
-            self.camOffsetY = self.PREFS.getpref('Y axis', 0, float, 'CAMERA_OFFSET')
-        except:
-            self.w.camera.hide()
-            msg0 = _translate('HandlerClass', 'Invalid entry for camera offset')
-            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}\n'.format(head, msg0))
+        self.camOffsetX = self.PREFS.getpref('X axis', 0, float, 'CAMERA_OFFSET')
+        self.camOffsetY = self.PREFS.getpref('Y axis', 0, float, 'CAMERA_OFFSET')
+        if self.PREFS.has_errors('CAMERA_OFFSET'):
+            self.camOffsetX = self.camOffsetY = 0.0
         if self.camOffsetX or self.camOffsetY:
             self.w.camview.set_camnum(self.camNum)
             self.idleHomedList.append('camera')
@@ -1085,43 +1522,61 @@ class HandlerClass:
         else:
             self.w.camera.hide()
         # probing
-        try:
-            self.probeOffsetX = self.PREFS.getpref('X axis', 0, float, 'OFFSET_PROBING')
-            self.probeOffsetY = self.PREFS.getpref('Y axis', 0, float, 'OFFSET_PROBING')
-            self.probeDelay = self.PREFS.getpref('Delay', 0, float, 'OFFSET_PROBING')
-        except:
-            msg0 = _translate('HandlerClass', 'Invalid entry for probe offset')
-            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}\n'.format(head, msg0))
+        self.probeOffsetX = self.PREFS.getpref('X axis', 0, float, 'OFFSET_PROBING')
+        self.probeOffsetY = self.PREFS.getpref('Y axis', 0, float, 'OFFSET_PROBING')
+        self.probeDelay = self.PREFS.getpref('Delay', 0, float, 'OFFSET_PROBING')
+
+    def prefs_error_report(self):
+        if not self.PREFS.errors:
+            return
+        head = _translate('HandlerClass', 'Prefs File Error')
+        msg0 = _translate('HandlerClass', 'Invalid entries, using default values')
+        entries = '\n'.join(['[{}] {} = {}'.format(section, option, value) for section, option, value in self.PREFS.errors])
+        STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}:\n{}\n'.format(head, msg0, entries))
+        self.PREFS.errors = []
 
 # called by the modified closeEvent function in this handler
     def closing_cleanup__(self):
+        self.workers.shutdown(wait=False)
+        self.pmx485_watch_stop()
         # disconnect powermax
         self.w.pmx485_enable.setChecked(False)
         # close soft keyboard
         self.vkb_hide()
         # turn autorepeat back on for the OS
         self.autorepeat_keys(True)
+        log = _translate('HandlerClass', 'Flasher label updates')
+        STATUS.emit('update-machine-log', '{}: {} applied, {} skipped'.format(log, self.labels.applied, self.labels.skipped), 'TIME')
+        self.callbackTimer.write_report()
         # save the log files
         self.save_logfile(5)
+        # remove the framing subroutines
+        self.frame_path_clear()
         # save preferences
         if not self.PREFS: return
-        self.PREFS.putpref('Use keyboard shortcuts', self.w.chk_keyboard_shortcuts.isChecked(), bool, 'GUI_OPTIONS')
-        self.PREFS.putpref('Use soft keyboard', self.w.chk_soft_keyboard.isChecked(), bool, 'GUI_OPTIONS')
-        self.PREFS.putpref('Show materials', self.w.chk_overlay.isChecked(), bool, 'GUI_OPTIONS')
-        self.PREFS.putpref('Run from line', self.w.chk_run_from_line.isChecked(), bool, 'GUI_OPTIONS')
-        self.PREFS.putpref('Tool tips', self.w.chk_tool_tips.isChecked(), bool, 'GUI_OPTIONS')
-        self.PREFS.putpref('Exit warning', self.w.chk_exit_warning.isChecked(), bool, 'GUI_OPTIONS')
-        self.PREFS.putpref('Exit warning text', self.exitMessage, str, 'GUI_OPTIONS')
-        self.PREFS.putpref('Preview cone size', self.w.cone_size.value(), float, 'GUI_OPTIONS')
-        self.PREFS.putpref('Preview grid size', self.w.grid_size.value(), float, 'GUI_OPTIONS')
-        self.PREFS.putpref('T view zoom scale', self.w.table_zoom_scale.value(), float, 'GUI_OPTIONS')
-        self.PREFS.putpref('THC auto', self.w.thc_auto.isChecked(), bool, 'ENABLE_OPTIONS')
-        self.PREFS.putpref('Override jog inhibit via Z+', self.zPlusOverrideJog, bool, 'GUI_OPTIONS')
-        self.PREFS.putpref('THC enable', self.w.thc_enable.isChecked(), bool, 'ENABLE_OPTIONS')
-        self.PREFS.putpref('Corner lock enable', self.w.cornerlock_enable.isChecked(), bool, 'ENABLE_OPTIONS')
-        self.PREFS.putpref('Void lock enable', self.w.voidlock_enable.isChecked(), bool, 'ENABLE_OPTIONS')
-        self.PREFS.putpref('Use auto volts', self.w.use_auto_volts.isChecked(), bool, 'ENABLE_OPTIONS')
-        self.PREFS.putpref('Ohmic probe enable', self.w.ohmic_probe_enable.isChecked(), bool, 'ENABLE_OPTIONS')
+        with self.PREFS.transaction():
+            self.PREFS.putpref('Use keyboard shortcuts', self.w.chk_keyboard_shortcuts.isChecked(), bool, 'GUI_OPTIONS')
+            self.PREFS.putpref('Use soft keyboard', self.w.chk_soft_keyboard.isChecked(), bool, 'GUI_OPTIONS')
+            self.PREFS.putpref('Show materials', self.w.chk_overlay.isChecked(), bool, 'GUI_OPTIONS')
+            self.PREFS.putpref('Run from line', self.w.chk_run_from_line.isChecked(), bool, 'GUI_OPTIONS')
+            self.PREFS.putpref('Tool tips', self.w.chk_tool_tips.isChecked(), bool, 'GUI_OPTIONS')
+            self.PREFS.putpref('Exit warning', self.w.chk_exit_warning.isChecked(), bool, 'GUI_OPTIONS')
+            self.PREFS.putpref('Exit warning text', self.exitMessage, str, 'GUI_OPTIONS')
+            self.PREFS.putpref('Preview cone size', self.w.cone_size.value(), float, 'GUI_OPTIONS')
+            self.PREFS.putpref('Preview grid size', self.w.grid_size.value(), float, 'GUI_OPTIONS')
+            self.PREFS.putpref('T view zoom scale', self.w.table_zoom_scale.value(), float, 'GUI_OPTIONS')
+            self.PREFS.putpref('THC auto', self.w.thc_auto.isChecked(), bool, 'ENABLE_OPTIONS')
+            self.PREFS.putpref('Override jog inhibit via Z+', self.zPlusOverrideJog, bool, 'GUI_OPTIONS')
+            self.PREFS.putpref('THC enable', self.w.thc_enable.isChecked(), bool, 'ENABLE_OPTIONS')
+            self.PREFS.putpref('Corner lock enable', self.w.cornerlock_enable.isChecked(), bool, 'ENABLE_OPTIONS')
+            self.PREFS.putpref('Void lock enable', self.w.voidlock_enable.isChecked(), bool, 'ENABLE_OPTIONS')
+            self.PREFS.putpref('Use auto volts', self.w.use_auto_volts.isChecked(), bool, 'ENABLE_OPTIONS')
+            self.PREFS.putpref('Ohmic probe enable', self.w.ohmic_probe_enable.isChecked(), bool, 'ENABLE_OPTIONS')
+        # the prefs file has changed so refresh its time in the update fingerprint
+        if self.updateFingerprint:
+            prefsFile = os.path.join(self.PATHS.CONFIGPATH, self.machineName + '.prefs')
+            self.updateFingerprint['files'][prefsFile] = os.path.getmtime(prefsFile)
+            self.update_fingerprint_save()
 
     def save_logfile(self, numLogs):
             logPre = 'machine_log_'
@@ -1271,6 +1726,7 @@ class HandlerClass:
                     QPushButton {{ color: {2}; background: {1}; border-color: {2} }} \
                     QPushButton:pressed {{ color: {2}; background: {1}; border-color: {0} }}' \
                     .format(self.foreColor, self.backColor, self.disabledColor))
+            self.mdiQueue.clear()
             if not self.firstRun:
                 log = _translate('HandlerClass', 'Emergency stop pressed')
                 STATUS.emit('update-machine-log', log, 'TIME')
@@ -1314,6 +1770,7 @@ class HandlerClass:
         self.set_jog_button_state()
 
     def interp_idle(self, obj):
+        self.progRun = False
         hal.set_p('plasmac.consumable-change', '0')
         if self.single_cut_request:
             self.single_cut_request = False
@@ -1324,7 +1781,7 @@ class HandlerClass:
                 self.file_clear_clicked()
             self.w[self.scButton].setEnabled(True)
             if self.g91:
-                ACTION.CALL_MDI_WAIT('G91')
+                self.mdiQueue.put('G91')
         if not self.manualCut:
             self.set_buttons_state([self.idleList], True)
         if self.lastLoadedProgram == 'None':
@@ -1401,6 +1858,7 @@ class HandlerClass:
         pass
 
     def interp_running(self, obj):
+        self.progRun = STATUS.is_auto_mode()
         self.w.run.setEnabled(False)
         if self.frButton:
             self.w[self.frButton].setEnabled(False)
@@ -1557,8 +2015,7 @@ class HandlerClass:
     def joints_all_homed(self, obj):
         self.interp_idle(None)
         if not self.firstHoming:
-            ACTION.CALL_MDI_WAIT('T0 M6')
-            ACTION.SET_MANUAL_MODE()
+            self.mdiQueue.put('T0 M6', ACTION.SET_MANUAL_MODE)
             self.firstHoming = True
         self.w.gcodegraphics.updateGL()
         self.w.conv_preview.updateGL()
@@ -1677,6 +2134,7 @@ class HandlerClass:
     def update_gcode_properties(self, props):
         if props:
             self.gcodeProps = props
+            self.frameHull = self.program_hull() if self.frHull else []
             if props['gcode_units'] == 'in':
                 STATUS.emit('metric-mode-changed', False)
             else:
@@ -1758,7 +2216,7 @@ class HandlerClass:
             self.rflActive = True
             self.rflSelected = False
             if self.developmentPin.get():
-                reload(RFL)
+                RFL.reload()
             head = _translate('HandlerClass', 'Gcode Error')
             data = RFL.run_from_line_get(self.lastLoadedProgram, self.startLine)
             # cannot do run from line within a subroutine or if using cutter compensation
@@ -1837,7 +2295,7 @@ class HandlerClass:
             log = _translate('HandlerClass', 'Torch pulse aborted')
             STATUS.emit('update-machine-log', log, 'TIME')
         else:
-            ACTION.ABORT()
+            self.mdiQueue.abort()
             if hal.get_value('plasmac.cut-recovery'):
                 hal.set_p('plasmac.cut-recovery', '0')
                 self.laserOnPin.set(0)
@@ -1927,7 +2385,7 @@ class HandlerClass:
                     outFile.write("Unknown error opening /tmp/linuxcnc_info.txt\n")
             else:
                 outFile.write('Unknown error creating /tmp/linuxcnc_info.txt\n')
-        with tarfile.open('{}/{}'.format(bkpPath, bkpName), mode='w:gz', ) as archive:
+        with TARFILE.open('{}/{}'.format(bkpPath, bkpName), mode='w:gz', ) as archive:
             archive.add('{}'.format(self.PATHS.CONFIGPATH))
         try:
             os.remove(tmpFile)
@@ -1944,8 +2402,14 @@ class HandlerClass:
             reload(OFFSETS)
         self.w.main_tab_widget.setCurrentIndex(0)
         if STATUS.stat.rotation_xy:
-            ACTION.CALL_MDI_WAIT('G10 L2 P0 R0')
-            ACTION.SET_MANUAL_MODE()
+            self.mdiQueue.put('G10 L2 P0 R0', self.set_offsets_show)
+        else:
+            self.set_offsets_show()
+
+    def set_offsets_show(self):
+        ACTION.SET_MANUAL_MODE()
+        if self.mdiQueue.aborted:
+            return
         OFFSETS.dialog_show(self, self.w, self.PREFS, INIPATH, STATUS, ACTION, TOOL)
 
     def feed_label_pressed(self):
@@ -2051,9 +2515,7 @@ class HandlerClass:
             self.w.material_selector.setCurrentIndex(0)
             self.w.conv_material.setCurrentIndex(0)
             if self.w.lbl_tool.text() != 'TORCH' and STATUS.is_on_and_idle() and STATUS.is_all_homed():
-                ACTION.CALL_MDI_WAIT('T0 M6')
-                ACTION.CALL_MDI_WAIT('G43 H0')
-                ACTION.SET_MANUAL_MODE()
+                self.mdiQueue.put(['T0 M6', 'G43 H0'], ACTION.SET_MANUAL_MODE)
             log = _translate('HandlerClass', 'Program cleared')
             STATUS.emit('update-machine-log', log, 'TIME')
         else:
@@ -2114,6 +2576,7 @@ class HandlerClass:
         t = time.time() + 0.01
         while time.time() < t:
             QApplication.processEvents()
+        self.lazy_tab_setup(tab)
         if tab == 0:
             if self.w.preview_stack.currentIndex() == 2:
                 self.vkb_show()
@@ -2125,7 +2588,7 @@ class HandlerClass:
             self.w.conv_preview.logger.clear()
             self.w.conv_preview.set_current_view()
             if self.developmentPin.get():
-                reload(self.CONV)
+                self.CONV.reload()
             self.CONV.conv_setup(self, self.w)
             self.vkb_show(True)
             self.autorepeat_keys(True)
@@ -2141,6 +2604,30 @@ class HandlerClass:
             self.w.machinelog.setCursorWidth(0)
             self.error_status(False)
 
+    # the settings and statistics tabs are populated when first shown rather than at startup
+    def lazy_tab_setup(self, tab):
+        if tab == self.w.main_tab_widget.count() - 1:
+            name, setup = 'statistics', self.statistics_show
+        elif tab == 3:
+            name, setup = 'settings', self.settings_tab_setup
+        else:
+            return
+        if name in self.tabsLoaded:
+            return
+        startTime = time.time()
+        self.tabsLoaded.append(name)
+        setup()
+        log = _translate('HandlerClass', 'tab populated on first use, startup time saved')
+        STATUS.emit('update-machine-log', '{} {}: {:0.3f} s'.format(name.capitalize(), log, time.time() - startTime), 'TIME')
+
+    def settings_tab_setup(self):
+        for bNum in range(1,21):
+            bName = self.PREFS.getpref('{} Name'.format(bNum), '', str, 'BUTTONS') or None
+            bCode = self.PREFS.getpref('{} Code'.format(bNum), '', str, 'BUTTONS') or None
+            if bName or bCode:
+                self.w['ub_name_{}'.format(bNum)].setText(bName)
+                self.w['ub_code_{}'.format(bNum)].setText(bCode)
+
     def z_height_changed(self, value):
         self.w.dro_z.update_user(value * self.droScale)
 
@@ -2330,6 +2817,10 @@ class HandlerClass:
         halfiles = self.iniFile.findall('HAL', 'HALFILE') or None
         machinePrefsFile = os.path.join(self.PATHS.CONFIGPATH, self.machineName + '.prefs')
         qtvcpPrefsFile = os.path.join(self.PATHS.CONFIGPATH, 'qtvcp.prefs')
+        # skip the update checks if nothing has changed since they last ran
+        self.updateFingerprint = self.update_fingerprint(halfiles, machinePrefsFile, qtvcpPrefsFile)
+        if self.updateFingerprint['update'] and self.updateFingerprint == self.update_fingerprint_load():
+            return
         # use qtplasmac_comp.hal for component connections (pre V1.221.154 2022/01/18)
         if halfiles and not [f for f in halfiles if 'plasmac.tcl' in f] and not \
             [f for f in halfiles if 'qtplasmac_comp.hal' in f]:
@@ -2371,6 +2862,47 @@ class HandlerClass:
             data = inFile.read()
             if data.count('Port') > 1:
                 UPDATER.move_port(self.PREFS)
+        # only save the fingerprint if there are no pending INI file changes
+        if self.updateIni:
+            self.updateFingerprint = None
+        else:
+            self.updateFingerprint = self.update_fingerprint(halfiles, machinePrefsFile, qtvcpPrefsFile)
+            self.update_fingerprint_save()
+
+    # a digest of the update_check and update_iniwrite source so that adding
+    # or changing an update invalidates every saved fingerprint, None if the
+    # source is not available in which case the updates are never skipped
+    @staticmethod
+    def update_digest():
+        try:
+            source = inspect.getsource(HandlerClass.update_check) + inspect.getsource(HandlerClass.update_iniwrite)
+        except (OSError, TypeError):
+            return None
+        return hashlib.sha1(source.encode()).hexdigest()
+
+    def update_fingerprint(self, halfiles, machinePrefsFile, qtvcpPrefsFile):
+        files = [INIPATH, machinePrefsFile, qtvcpPrefsFile, os.path.join(self.PATHS.CONFIGPATH, 'qtplasmac.prefs'), \
+                 os.path.join(self.PATHS.CONFIGPATH, 'qtplasmac')]
+        for halfile in halfiles or []:
+            files.append(os.path.join(self.PATHS.CONFIGPATH, halfile))
+        mtimes = {}
+        for file in files:
+            mtimes[file] = os.lstat(file).st_mtime if os.path.lexists(file) else None
+        return {'version': VERSION, 'update': self.update_digest(), 'files': mtimes}
+
+    def update_fingerprint_load(self):
+        try:
+            with open(os.path.join(self.PATHS.CONFIGPATH, '.qtplasmac_update'), 'r') as inFile:
+                return json.load(inFile)
+        except:
+            return None
+
+    def update_fingerprint_save(self):
+        try:
+            with open(os.path.join(self.PATHS.CONFIGPATH, '.qtplasmac_update'), 'w') as outFile:
+                json.dump(self.updateFingerprint, outFile, indent=2)
+        except:
+            LOG.debug('Cannot save update fingerprint')
 
     def update_iniwrite(self):
         # this is for updates that write to the INI file
@@ -2393,10 +2925,14 @@ class HandlerClass:
             self.currentX = STATUS.stat.g5x_offset[0]
             self.currentY = STATUS.stat.g5x_offset[1]
         elif wcs == 'set':
-            ACTION.CALL_MDI_WAIT('G10 L2 P0 X{} Y{} R{}'.format(self.currentX, self.currentY, self.currentRotation))
-            if self.currentRotation != STATUS.stat.rotation_xy:
-                self.w.gcodegraphics.set_current_view()
-            ACTION.SET_MANUAL_MODE()
+            rotation = STATUS.stat.rotation_xy
+            command = 'G10 L2 P0 X{} Y{} R{}'.format(self.currentX, self.currentY, self.currentRotation)
+            self.mdiQueue.put(command, lambda: self.wcs_rotation_done(rotation))
+
+    def wcs_rotation_done(self, rotation):
+        if self.currentRotation != rotation:
+            self.w.gcodegraphics.set_current_view()
+        ACTION.SET_MANUAL_MODE()
 
     def set_buttons_state(self, buttonLists, state):
         for buttonList in buttonLists:
@@ -2427,12 +2963,19 @@ class HandlerClass:
             text = ''
         self.w.error_label.setText('{}'.format(text))
 
+    # repeated touch offs are coalesced by the mdi queue so the interpreter may
+    # still be busy with the previous one, but never with anything else
     def touch_off_xy(self, x, y):
-        if STATUS.is_on_and_idle() and STATUS.is_all_homed():
-            ACTION.CALL_MDI_WAIT('G10 L20 P0 X{} Y{}'.format(x, y))
-            if self.fileOpened == True:
-                self.file_reload_clicked()
-            ACTION.SET_MANUAL_MODE()
+        command = 'G10 L20 P0 X{} Y{}'.format(x, y)
+        if (STATUS.is_on_and_idle() or STATUS.machine_is_on() and self.mdiQueue.coalesces(command)) and STATUS.is_all_homed():
+            self.mdiQueue.put(command, self.touch_off_done)
+
+    def touch_off_done(self):
+        if self.mdiQueue.aborted:
+            return
+        if self.fileOpened == True:
+            self.file_reload_clicked()
+        ACTION.SET_MANUAL_MODE()
 
     def bounds_check(self, boundsType, xOffset, yOffset):
         framing = True if 'framing' in boundsType else False
@@ -2446,11 +2989,15 @@ class HandlerClass:
         if framing:
             xStart = STATUS.stat.g5x_offset[0] + xOffset
             yStart = STATUS.stat.g5x_offset[1] + yOffset
-            xMin = round(float(self.gcodeProps['x_zero_rxy'].split()[0]) * boundsMultiplier + xOffset, 5)
-            xMax = round(float(self.gcodeProps['x_zero_rxy'].split()[2]) * boundsMultiplier + xOffset, 5)
-            yMin = round(float(self.gcodeProps['y_zero_rxy'].split()[0]) * boundsMultiplier + yOffset, 5)
-            yMax = round(float(self.gcodeProps['y_zero_rxy'].split()[2]) * boundsMultiplier + yOffset, 5)
-            coordinates = [[xStart, yStart], [xMin, yMin], [xMin, yMax], [xMax, yMax], [xMax, yMin]]
+            # hull framing checks the limits at every vertex of the outline
+            if self.frHull and len(self.frameHull) > 2:
+                coordinates = [[xStart, yStart]] + [[round(x + xOffset, 5), round(y + yOffset, 5)] for x, y in self.frameHull]
+            else:
+                xMin = round(float(self.gcodeProps['x_zero_rxy'].split()[0]) * boundsMultiplier + xOffset, 5)
+                xMax = round(float(self.gcodeProps['x_zero_rxy'].split()[2]) * boundsMultiplier + xOffset, 5)
+                yMin = round(float(self.gcodeProps['y_zero_rxy'].split()[0]) * boundsMultiplier + yOffset, 5)
+                yMax = round(float(self.gcodeProps['y_zero_rxy'].split()[2]) * boundsMultiplier + yOffset, 5)
+                coordinates = [[xStart, yStart], [xMin, yMin], [xMin, yMax], [xMax, yMax], [xMax, yMin]]
             frame_points, xMin, yMin, xMax, yMax = self.rotate_frame(coordinates)
         else:
             xMin = round(float(self.gcodeProps['x'].split()[0]) * boundsMultiplier + xOffset, 5)
@@ -2499,42 +3046,67 @@ class HandlerClass:
             rx = (tox * cos) - (toy * sin) + ox
             ry = (tox * sin) + (toy * cos) + oy
             frame_points.append([rx, ry])
-        xMin = min(frame_points[1:])[0]
-        xMax = max(frame_points[1:])[0]
-        yMin = min(frame_points[1:])[1]
-        yMax = max(frame_points[1:])[1]
+        xMin = min(point[0] for point in frame_points[1:])
+        xMax = max(point[0] for point in frame_points[1:])
+        yMin = min(point[1] for point in frame_points[1:])
+        yMax = max(point[1] for point in frame_points[1:])
         return frame_points, xMin, yMin, xMax, yMax
 
+    # convex hull of the cut moves in the loaded program in machine units
+    # preview positions include the offsets and rotation at load time so the rotation
+    # is removed to match the x_zero_rxy extents, rotate_frame applies the current rotation
+    def program_hull(self):
+        try:
+            moves = self.w.gcodegraphics.canon.feed + self.w.gcodegraphics.canon.arcfeed
+        except:
+            return []
+        # the preview works in inches
+        scale = 25.4 if self.units == 'mm' else 1
+        points = set()
+        for move in moves:
+            points.add((round(move[1][0] * scale, 5), round(move[1][1] * scale, 5)))
+            points.add((round(move[2][0] * scale, 5), round(move[2][1] * scale, 5)))
+        angle = math.radians(-STATUS.stat.rotation_xy)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        ox = STATUS.stat.g5x_offset[0]
+        oy = STATUS.stat.g5x_offset[1]
+        hull = []
+        for x, y in convex_hull(points):
+            hull.append([(x - ox) * cos - (y - oy) * sin + ox, (x - ox) * sin + (y - oy) * cos + oy])
+        return hull
+
     def save_plasma_parameters(self):
-        self.PREFS.putpref('Arc OK High', self.w.arc_ok_high.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Arc OK Low', self.w.arc_ok_low.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Arc Maximum Starts', self.w.arc_max_starts.value(), int, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Arc Fail Timeout', self.w.arc_fail_delay.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Arc Voltage Offset', self.w.arc_voltage_offset.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Arc Voltage Scale', self.w.arc_voltage_scale.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Velocity Anti Dive Threshold', self.w.cornerlock_threshold.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Float Switch Travel', self.w.float_switch_travel.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Height Per Volt', self.w.height_per_volt.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Void Sense Slope', self.w.voidlock_slope.value(), int, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Ohmic Maximum Attempts', self.w.ohmic_max_attempts.value(), int, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Ohmic Probe Offset', self.w.ohmic_probe_offset.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Pid P Gain', self.w.pid_p_gain.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Pid D Gain', self.w.pid_d_gain.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Pid I Gain', self.w.pid_i_gain.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Probe Feed Rate', self.w.probe_feed_rate.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Probe Start Height', self.w.probe_start_height.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Arc Restart Delay', self.w.arc_restart_delay.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Safe Height', self.w.safe_height.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Scribe Arming Delay', self.w.scribe_arm_delay.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Scribe On Delay', self.w.scribe_on_delay.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Setup Feed Rate', self.w.setup_feed_rate.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Skip IHS Distance', self.w.skip_ihs_distance.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Spotting Threshold', self.w.spotting_threshold.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('Spotting Time', self.w.spotting_time.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('THC Delay', self.w.thc_delay.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('THC Sample Counts', self.w.thc_sample_counts.value(), int, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('THC Sample Threshold', self.w.thc_sample_threshold.value(), float, 'PLASMA_PARAMETERS')
-        self.PREFS.putpref('THC Threshold', self.w.thc_threshold.value(), float, 'PLASMA_PARAMETERS')
+        with self.PREFS.transaction():
+            self.PREFS.putpref('Arc OK High', self.w.arc_ok_high.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Arc OK Low', self.w.arc_ok_low.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Arc Maximum Starts', self.w.arc_max_starts.value(), int, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Arc Fail Timeout', self.w.arc_fail_delay.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Arc Voltage Offset', self.w.arc_voltage_offset.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Arc Voltage Scale', self.w.arc_voltage_scale.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Velocity Anti Dive Threshold', self.w.cornerlock_threshold.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Float Switch Travel', self.w.float_switch_travel.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Height Per Volt', self.w.height_per_volt.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Void Sense Slope', self.w.voidlock_slope.value(), int, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Ohmic Maximum Attempts', self.w.ohmic_max_attempts.value(), int, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Ohmic Probe Offset', self.w.ohmic_probe_offset.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Pid P Gain', self.w.pid_p_gain.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Pid D Gain', self.w.pid_d_gain.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Pid I Gain', self.w.pid_i_gain.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Probe Feed Rate', self.w.probe_feed_rate.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Probe Start Height', self.w.probe_start_height.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Arc Restart Delay', self.w.arc_restart_delay.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Safe Height', self.w.safe_height.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Scribe Arming Delay', self.w.scribe_arm_delay.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Scribe On Delay', self.w.scribe_on_delay.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Setup Feed Rate', self.w.setup_feed_rate.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Skip IHS Distance', self.w.skip_ihs_distance.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Spotting Threshold', self.w.spotting_threshold.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('Spotting Time', self.w.spotting_time.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('THC Delay', self.w.thc_delay.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('THC Sample Counts', self.w.thc_sample_counts.value(), int, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('THC Sample Threshold', self.w.thc_sample_threshold.value(), float, 'PLASMA_PARAMETERS')
+            self.PREFS.putpref('THC Threshold', self.w.thc_threshold.value(), float, 'PLASMA_PARAMETERS')
 
     def load_plasma_parameters(self):
         self.w.setup_feed_rate.setValue(self.PREFS.getpref('Setup Feed Rate', self.thcFeedRate * 0.8, float, 'PLASMA_PARAMETERS'))
@@ -2812,7 +3384,7 @@ class HandlerClass:
 
     def conv_call(self, operation):
         if self.developmentPin.get():
-            reload(self.CONV)
+            self.CONV.reload()
         if operation == 'block':
             self.CONV.conv_block_pressed(self, self.w)
         elif operation == 'new':
@@ -2827,16 +3399,9 @@ class HandlerClass:
             self.CONV.conv_shape_request(self, self.w, 'conv_{}'.format(operation), True)
 
     def set_axes_and_joints(self):
-        kinematics = self.iniFile.find('KINS', 'KINEMATICS').lower().replace('=','').replace('trivkins','').replace(' ','') or None
-        #kinstype = None
         self.coordinates = 'xyz'
-        if kinematics:
-            if 'kinstype' in kinematics:
-                #kinstype = kinematics.lower().replace(' ','').split('kinstype')[1]
-                if 'coordinates' in kinematics:
-                    kinematics = kinematics.lower().replace(' ','').split('kinstype')[0]
-            if 'coordinates' in kinematics:
-                self.coordinates = kinematics.split('coordinates')[1].lower()
+        if self.ini.kinematics():
+            self.coordinates = self.ini.coordinates() or self.coordinates
         else:
             head = _translate('HandlerClass', 'INI File Error')
             msg0  = _translate('HandlerClass', 'Error in [KINS]KINEMATICS in the INI file')
@@ -2855,11 +3420,12 @@ class HandlerClass:
             self.w['home_{}'.format(axis)].set_joint(self.coordinates.index(axis))
             self.w['home_{}'.format(axis)].set_joint_number(self.coordinates.index(axis))
         for joint in range(len(self.coordinates)):
+            homeSequence = self.ini.joint(joint)['home_sequence']
             # check if home all button required
-            if not self.iniFile.find('JOINT_{}'.format(joint), 'HOME_SEQUENCE'):
+            if not homeSequence:
                 self.w.home_all.hide()
             # check if not joggable before homing
-            elif self.iniFile.find('JOINT_{}'.format(joint), 'HOME_SEQUENCE').startswith('-'):
+            elif homeSequence.startswith('-'):
                 if 'jog_{}_plus'.format(self.coordinates[joint]) not in self.jogSyncList:
                     self.jogSyncList.append('jog_{}_plus'.format(self.coordinates[joint]))
                     self.jogSyncList.append('jog_{}_minus'.format(self.coordinates[joint]))
@@ -3116,30 +3682,26 @@ class HandlerClass:
             self[pin].set(not hal.get_value(halpin))
         else:
             hal.set_p(halpin, str(not hal.get_value(halpin)))
-        self.set_button_color()
+        self.set_button_color(hal.get_value)
 
-    def set_button_color(self):
+    # the periodic update reads the pin snapshot, button callbacks read the pins live
+    def set_button_color(self, read=None):
+        read = read or self.halSnapshot.get
+        # only restyle a button when its pin state differs from the last style applied
         for halpin in self.halTogglePins:
-            color = self.w[self.halTogglePins[halpin][0]].palette().color(QtGui.QPalette.Background)
-            if hal.get_value(halpin):
-                if color != self.w.color_foregalt.palette().color(QPalette.Background):
-                    self.button_active(self.halTogglePins[halpin][0])
-            else:
-                if color != self.w.color_backgrnd.palette().color(QPalette.Background):
-                    self.button_normal(self.halTogglePins[halpin][0])
+            self.set_button_style(self.halTogglePins[halpin][0], read(halpin))
         for halpin in self.halPulsePins:
-            color = self.w[self.halPulsePins[halpin][0]].palette().color(QtGui.QPalette.Background)
-            if hal.get_value(halpin):
-                if color != self.w.color_foregalt.palette().color(QPalette.Background):
-                    self.button_active(self.halPulsePins[halpin][0])
-            else:
-                if color != self.w.color_backgrnd.palette().color(QPalette.Background):
-                    self.button_normal(self.halPulsePins[halpin][0])
+            self.set_button_style(self.halPulsePins[halpin][0], read(halpin))
         if self.tlButton:
-            if self.laserOnPin.get():
-                self.button_active(self.tlButton)
+            self.set_button_style(self.tlButton, self.laserOnPin.get())
+
+    def set_button_style(self, button, state):
+        state = bool(state)
+        if self.buttonStyles.get(button) != state:
+            if state:
+                self.button_active(button)
             else:
-                self.button_normal(self.tlButton)
+                self.button_normal(button)
 
 
     def run_critical_check(self):
@@ -3317,102 +3879,157 @@ class HandlerClass:
         self.set_signal_connections()
         if self.firstRun is True:
             self.firstRun = False
+        if self.pmPort and not hal.component_exists('pmx485'):
+            self.pmx485_watch()
 
     def update_periodic(self):
-        if self.framing and STATUS.is_interp_idle():
+        self.halSnapshot.refresh()
+        self.scheduler.tick()
+        if not self.firstRun:
+            self.user_periodic()
+
+    # background work is suspended while a program is running or the torch is on
+    def machine_busy(self):
+        self.torchOn = self.halSnapshot['plasmac.torch-on']
+        return self.progRun or self.torchOn
+
+    def framing_done(self):
+        if self.framing:
             self.framing = False
             ACTION.SET_MANUAL_MODE()
             self.laserOnPin.set(0)
             self.w.gcodegraphics.logger.clear()
-        self.set_button_color()
-        if self.flasher:
-            self.flasher -= 1
-        else:
-            self.flasher = self.flashRate
-            self.flashState = not self.flashState
-            self.flasher_timeout()
-        if not self.firstRun and self.pmPort and not hal.component_exists('pmx485'):
-            if self.pmx485_check(self.pmPort, True):
-                self.w.gas_pressure.show()
-                self.w.gas_pressure_label.show()
-                self.w.cut_mode.show()
-                self.w.cut_mode_label.show()
-                self.w.pmx485_frame.show()
-                self.w.pmx_stats_frame.show()
-                self.pmx485_startup(self.pmPort)
-        if not self.firstRun and os.path.isfile(self.upFile):
-            exec(open(self.upFile).read())
+
+    def flasher_toggle(self):
+        self.flashState = not self.flashState
+        self.flasher_timeout()
+
+    # the user periodic file is only compiled again if it has been modified
+    # a file that can't be read, compiled or run is reported once and then
+    # disabled until it is modified
+    def user_periodic(self):
+        try:
+            mtime = os.path.getmtime(self.upFile)
+        except OSError:
+            self.upCode = self.upMtime = None
+            return
+        if mtime != self.upMtime:
+            self.upMtime = mtime
+            self.callbackTimer.add('user_periodic', 0.2)
+            try:
+                with open(self.upFile, 'r') as inFile:
+                    self.upCode = compile(inFile.read(), self.upFile, 'exec')
+            except (SyntaxError, ValueError, OSError) as err:
+                self.user_periodic_error(err)
+        if not self.upCode:
+            return
+        startTime = time.monotonic()
+        try:
+            exec(self.upCode, globals(), {'self': self})
+        except Exception as err:
+            self.user_periodic_error(err)
+        self.callbackTimer.record('user_periodic', time.monotonic() - startTime)
+
+    def user_periodic_error(self, err):
+        self.upCode = None
+        head = _translate('HandlerClass', 'User Periodic Error')
+        STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}\n'.format(head, err))
+
+    def callback_overrun(self, name, duration, budget):
+        log = _translate('HandlerClass', 'Callback overran its share of the GUI cycle')
+        STATUS.emit('update-machine-log', '{}: {} {:0.1f} ms > {:0.1f} ms'.format(log, name, duration * 1000, budget * 1000), 'TIME')
+
+    def callback_timing_show(self):
+        head = _translate('HandlerClass', 'Callback Timing')
+        self.dialog_show_ok(QMessageBox.Information, head, '<pre>{}\n\n{}</pre>'.format(self.callbackTimer.report(), self.mdiQueue.report()))
 
     def flasher_timeout(self):
+        if not self.flashText:
+            self.flasher_text_setup()
         if STATUS.is_auto_paused():
             if self.flashState:
-                self.w.pause.setText(_translate('HandlerClass', 'CYCLE RESUME'))
+                self.labels.set_text(self.w.pause, self.flashText['CYCLE RESUME'])
             else:
-                self.w.pause.setText('')
+                self.labels.set_text(self.w.pause, '')
         elif not self.w.jog_stack.currentIndex():
-            self.w.pause.setText(_translate('HandlerClass', 'CYCLE PAUSE'))
-        text = _translate('HandlerClass', 'FEED')
+            self.labels.set_text(self.w.pause, self.flashText['CYCLE PAUSE'])
+        text = self.flashText['FEED']
         if self.w.feed_slider.value() != 100:
             if self.flashState:
-                self.w.feed_label.setText('{}\n{:.0f}%'.format(text, STATUS.stat.feedrate * 100))
+                self.labels.set_text(self.w.feed_label, '{}\n{:.0f}%'.format(text, STATUS.stat.feedrate * 100))
             else:
-                self.w.feed_label.setText(' \n ')
+                self.labels.set_text(self.w.feed_label, ' \n ')
         else:
-            self.w.feed_label.setText('{}\n{:.0f}%'.format(text, STATUS.stat.feedrate * 100))
-        text = _translate('HandlerClass', 'RAPID')
+            self.labels.set_text(self.w.feed_label, '{}\n{:.0f}%'.format(text, STATUS.stat.feedrate * 100))
+        text = self.flashText['RAPID']
         if self.w.rapid_slider.value() != 100:
             if self.flashState:
-                self.w.rapid_label.setText('{}\n{:.0f}%'.format(text, STATUS.stat.rapidrate * 100))
+                self.labels.set_text(self.w.rapid_label, '{}\n{:.0f}%'.format(text, STATUS.stat.rapidrate * 100))
             else:
-                self.w.rapid_label.setText(' \n ')
+                self.labels.set_text(self.w.rapid_label, ' \n ')
         else:
-            self.w.rapid_label.setText('{}\n{:.0f}%'.format(text, STATUS.stat.rapidrate * 100))
-        text = _translate('HandlerClass', 'JOG')
+            self.labels.set_text(self.w.rapid_label, '{}\n{:.0f}%'.format(text, STATUS.stat.rapidrate * 100))
+        text = self.flashText['JOG']
         if self.manualCut:
             if self.flashState:
-                self.w.run.setText(_translate('HandlerClass', 'MANUAL CUT'))
-                self.w.jogs_label.setText('{}\n{:.0f}'.format(text, STATUS.get_jograte()))
+                self.labels.set_text(self.w.run, self.flashText['MANUAL CUT'])
+                self.labels.set_text(self.w.jogs_label, '{}\n{:.0f}'.format(text, STATUS.get_jograte()))
             else:
-                self.w.run.setText('')
-                self.w.jogs_label.setText(' \n ')
+                self.labels.set_text(self.w.run, '')
+                self.labels.set_text(self.w.jogs_label, ' \n ')
         if self.heightOvr > 0.01 or self.heightOvr < -0.01:
             if self.flashState:
-                self.w.height_ovr_label.setText('{:.2f}'.format(self.heightOvr))
+                self.labels.set_text(self.w.height_ovr_label, '{:.2f}'.format(self.heightOvr))
             else:
-                self.w.height_ovr_label.setText('')
+                self.labels.set_text(self.w.height_ovr_label, '')
         else:
-            self.w.height_ovr_label.setText('{:.2f}'.format(self.heightOvr))
+            self.labels.set_text(self.w.height_ovr_label, '{:.2f}'.format(self.heightOvr))
         if self.flash_error and self.error_present:
             if self.flashState:
-                self.w.error_label.setText(_translate('HandlerClass', 'ERROR SENT TO MACHINE LOG'))
+                self.labels.set_text(self.w.error_label, self.flashText['ERROR SENT TO MACHINE LOG'])
             else:
-                self.w.error_label.setText('')
+                self.labels.set_text(self.w.error_label, '')
         if self.startLine > 0:
-            if not self.w.run.text().startswith(_translate('HandlerClass', 'RUN')):
+            if not self.w.run.text().startswith(self.flashText['RUN']):
                 if self.flashState:
-                    self.w.run.setText(self.runText)
+                    self.labels.set_text(self.w.run, self.runText)
                 else:
-                    self.w.run.setText('')
+                    self.labels.set_text(self.w.run, '')
         elif not self.manualCut:
-            self.w.run.setText(_translate('HandlerClass', 'CYCLE START'))
+            self.labels.set_text(self.w.run, self.flashText['CYCLE START'])
         if not self.w.pmx485_enable.isChecked():
-            self.w.pmx485_label.setText('')
+            self.labels.set_text(self.w.pmx485_label, '')
             self.pmx485LabelState = None
         elif self.pmx485CommsError:
             if self.flashState:
-                self.w.pmx485_label.setText(_translate('HandlerClass', 'COMMS ERROR'))
+                self.labels.set_text(self.w.pmx485_label, self.flashText['COMMS ERROR'])
                 self.pmx485LabelState = None
             else:
-                self.w.pmx485_label.setText('')
+                self.labels.set_text(self.w.pmx485_label, '')
                 self.pmx485LabelState = None
         elif not self.pmx485LabelState:
             if self.flashState:
-                self.w.pmx485_label.setText('Fault Code: {}'.format(self.pmx485FaultCode))
+                self.labels.set_text(self.w.pmx485_label, 'Fault Code: {}'.format(self.pmx485FaultCode))
                 self.pmx485LabelState = None
             else:
-                self.w.pmx485_label.setText('')
+                self.labels.set_text(self.w.pmx485_label, '')
                 self.pmx485LabelState = None
 
+    # translate the flasher text once rather than on every flash
+    def flasher_text_setup(self):
+        self.flashText = {
+                'CYCLE RESUME': _translate('HandlerClass', 'CYCLE RESUME'),
+                'CYCLE PAUSE': _translate('HandlerClass', 'CYCLE PAUSE'),
+                'FEED': _translate('HandlerClass', 'FEED'),
+                'RAPID': _translate('HandlerClass', 'RAPID'),
+                'JOG': _translate('HandlerClass', 'JOG'),
+                'MANUAL CUT': _translate('HandlerClass', 'MANUAL CUT'),
+                'ERROR SENT TO MACHINE LOG': _translate('HandlerClass', 'ERROR SENT TO MACHINE LOG'),
+                'RUN': _translate('HandlerClass', 'RUN'),
+                'CYCLE START': _translate('HandlerClass', 'CYCLE START'),
+                'COMMS ERROR': _translate('HandlerClass', 'COMMS ERROR'),
+                }
+
     def probe_timeout(self):
         if self.probeTime > 1:
             self.probeTime -= 1
@@ -3486,6 +4103,7 @@ class HandlerClass:
 # USER BUTTON FUNCTIONS #
 #########################################################################################################################
     def user_button_setup(self):
+        self.buttonStyles = {}
         self.iniButtonCodes = ['Codes']
         iniButtonCodes = ['Codes']
         self.probePressed = False
@@ -3509,7 +4127,7 @@ class HandlerClass:
             self.w['button_{}'.format(str(bNum))].setEnabled(False)
             bName = self.PREFS.getpref('{} Name'.format(bNum), '', str, 'BUTTONS') or None
             bCode = self.PREFS.getpref('{} Code'.format(bNum), '', str, 'BUTTONS') or None
-            if bName or bCode:
+            if (bName or bCode) and 'settings' in self.tabsLoaded:
                 self.w['ub_name_{}'.format(bNum)].setText(bName)
                 self.w['ub_code_{}'.format(bNum)].setText(bCode)
             if (bCode and not bName) or (not bCode and bName):
@@ -3597,10 +4215,14 @@ class HandlerClass:
                 frButton = True
                 self.defaultZ = True
                 self.frFeed = 0
+                self.frHull = False
                 bCode = bCode.lower().replace('framing', '').strip()
                 if 'usecurrentzheight' in bCode:
                     bCode = bCode.lower().replace('usecurrentzheight', '').strip()
                     self.defaultZ = False
+                if 'hull' in bCode:
+                    bCode = bCode.lower().replace('hull', '').strip()
+                    self.frHull = True
                 if len(bCode):
                     if bCode[0] == 'f':
                         try:
@@ -3849,24 +4471,27 @@ class HandlerClass:
                 STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{} #{}\n'.format(head, msg0, bNum))
         else:
             self.reloadRequired = False
-            for command in commands.split('\\'):
-                command = command.strip()
-                self.user_button_command(bNum, command)
-                if command[0] == "%":
-                    continue
-                while not STATUS.is_interp_idle():
-                    self.w.gcodegraphics.updateGL()
-                    QApplication.processEvents()
-                if command.lower().replace(' ', '').startswith('g10l20') and self.fileOpened:
-                    self.reloadRequired = True
-            if self.reloadRequired:
-                self.file_reload_clicked()
-            else:
-                self.w.gcodegraphics.logger.clear()
-            ACTION.SET_MANUAL_MODE()
+            self.user_button_commands(bNum, commands.split('\\'))
+
+    # each G-code command is queued when the previous command is complete
+    # the remaining commands are dropped if the mdi queue is aborted
+    def user_button_commands(self, bNum, commands):
+        if self.mdiQueue.aborted:
+            commands = []
+        while commands:
+            command = commands.pop(0).strip()
+            if command.lower().replace(' ', '').startswith('g10l20') and self.fileOpened:
+                self.reloadRequired = True
+            if self.user_button_command(bNum, command, lambda: self.user_button_commands(bNum, commands)):
+                return
+        if self.reloadRequired:
+            self.file_reload_clicked()
+        else:
+            self.w.gcodegraphics.logger.clear()
+        ACTION.SET_MANUAL_MODE()
 
-    # for G-code commands and external commands
-    def user_button_command(self, bNum, command):
+    # for G-code commands and external commands, True if a G-code command was queued
+    def user_button_command(self, bNum, command, done=None):
         if command and command[0].lower() in 'xyzabgmfsto' and command.replace(' ','')[1] in '0123456789<':
             if '{' in command:
                 newCommand = subCommand = ''
@@ -3875,14 +4500,15 @@ class HandlerClass:
                         subCommand = ':'
                     elif char == '}':
                         f1, f2 = subCommand.replace(':','').split()
-                        newCommand += self.iniFile.find(f1,f2)
+                        newCommand += self.ini.find(f1,f2)
                         subCommand = ''
                     elif subCommand.startswith(':'):
                         subCommand += char
                     else:
                         newCommand += char
                 command = newCommand
-            ACTION.CALL_MDI(command)
+            self.mdiQueue.put(command, done)
+            return True
         elif command and command[0] == '%':
             command = command.lstrip('%').lstrip()
             if command[-3:] == '.py':
@@ -4204,23 +4830,93 @@ class HandlerClass:
             zHeight = self.zMax - (hal.get_value('plasmac.max-offset') * self.unitsPerMm)
             if STATUS.is_on_and_idle() and STATUS.is_all_homed():
                 self.framing = True
+                commands = []
                 previousMode = ''
                 if self.units == 'in' and STATUS.is_metric_mode():
                     previousMode = 'G21'
-                    ACTION.CALL_MDI('G20')
+                    commands.append('G20')
                 elif self.units == 'mm' and not STATUS.is_metric_mode():
                     previousMode = 'G20'
-                    ACTION.CALL_MDI('G21')
-                ACTION.CALL_MDI_WAIT('G64 P{:0.3f}'.format(0.25 * self.unitsPerMm))
-                if self.defaultZ:
-                    ACTION.CALL_MDI('G53 G0 Z{:0.4f}'.format(zHeight))
-                ACTION.CALL_MDI('G53 G0 X{:0.2f} Y{:0.2f}'.format(frame_points[1][0], frame_points[1][1]))
-                ACTION.CALL_MDI('G53 G1 X{:0.2f} Y{:0.2f} F{:0.0f}'.format(frame_points[2][0], frame_points[2][1], feed))
-                ACTION.CALL_MDI('G53 G1 X{:0.2f} Y{:0.2f}'.format(frame_points[3][0], frame_points[3][1]))
-                ACTION.CALL_MDI('G53 G1 X{:0.2f} Y{:0.2f}'.format(frame_points[4][0], frame_points[4][1]))
-                ACTION.CALL_MDI('G53 G1 X{:0.2f} Y{:0.2f}'.format(frame_points[1][0], frame_points[1][1]))
-                ACTION.CALL_MDI('G0 X0 Y0')
-                ACTION.CALL_MDI(previousMode)
+                    commands.append('G21')
+                frameName = self.frame_program(frame_points, feed, zHeight)
+                if frameName:
+                    commands.append('o<{}> call'.format(frameName))
+                else:
+                    commands += self.frame_commands(frame_points, feed, zHeight)
+                commands.append(previousMode)
+                self.mdiQueue.put(commands, self.framing_done)
+
+    def frame_commands(self, frame_points, feed, zHeight):
+        commands = ['G64 P{:0.3f}'.format(0.25 * self.unitsPerMm)]
+        if self.defaultZ:
+            commands.append('G53 G0 Z{:0.4f}'.format(zHeight))
+        commands.append('G53 G0 X{:0.2f} Y{:0.2f}'.format(frame_points[1][0], frame_points[1][1]))
+        commands.append('G53 G1 X{:0.2f} Y{:0.2f} F{:0.0f}'.format(frame_points[2][0], frame_points[2][1], feed))
+        for x, y in frame_points[3:] + frame_points[1:2]:
+            commands.append('G53 G1 X{:0.2f} Y{:0.2f}'.format(x, y))
+        commands.append('G0 X0 Y0')
+        return commands
+
+    # the framing moves are written once as a subroutine and run with a single call
+    # so the trajectory planner can blend the corners, subroutines are cached by frame
+    def frame_program(self, frame_points, feed, zHeight):
+        if not self.framePath:
+            self.framePath = self.frame_path()
+            if not self.framePath:
+                return None
+        commands = self.frame_commands(frame_points, feed, zHeight)
+        key = '\n'.join(commands)
+        if key in self.frameCache:
+            return self.frameCache[key]
+        name = 'qtplasmac_frame_{}'.format(hashlib.sha1(key.encode()).hexdigest()[:12])
+        try:
+            with open(os.path.join(self.framePath, '{}.ngc'.format(name)), 'w') as outFile:
+                outFile.write('o<{0}> sub\n{1}\no<{0}> endsub\nM2\n'.format(name, key))
+        except:
+            return None
+        self.frameCache[key] = name
+        if len(self.frameCache) > self.frameCacheSize:
+            oldest = next(iter(self.frameCache))
+            try:
+                os.remove(os.path.join(self.framePath, '{}.ngc'.format(self.frameCache.pop(oldest))))
+            except:
+                pass
+        return name
+
+    # the framing subroutines are only written to the frame directory in the config
+    # so it must be in [RS274NGC]SUBROUTINE_PATH for the interpreter to find them
+    # the interpreter runs whatever is in there so it must be a private directory
+    # subroutines left by an earlier session are removed when it is first used
+    def frame_path(self):
+        framePath = os.path.normpath(os.path.join(self.PATHS.CONFIGPATH, 'frame'))
+        for path in (self.ini.find('RS274NGC', 'SUBROUTINE_PATH') or '').split(':'):
+            path = os.path.normpath(os.path.join(self.PATHS.CONFIGPATH, os.path.expanduser(path)))
+            if path == framePath:
+                try:
+                    if not os.path.lexists(framePath):
+                        os.mkdir(framePath, 0o700)
+                    info = os.lstat(framePath)
+                except OSError:
+                    return None
+                if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    head = _translate('HandlerClass', 'Framing Error')
+                    msg0 = _translate('HandlerClass', 'is not a private directory, framing uses single moves')
+                    STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{} {}\n'.format(head, framePath, msg0))
+                    return None
+                self.framePath = framePath
+                self.frame_path_clear()
+                return framePath
+        return None
+
+    def frame_path_clear(self):
+        self.frameCache = {}
+        if not self.framePath:
+            return
+        for frameFile in glob.glob(os.path.join(self.framePath, 'qtplasmac_frame_*.ngc')):
+            try:
+                os.remove(frameFile)
+            except OSError:
+                pass
 
     def single_cut(self):
         self.set_buttons_state([self.idleList, self.idleOnList, self.idleHomedList], False)
@@ -4309,6 +5005,7 @@ class HandlerClass:
                      QPushButton:pressed {{ color: {0}; background: {1} }} \
                      QPushButton:disabled {{ color: {2}}}' \
                      .format(self.backColor, self.fore1Color, self.disabledColor))
+        self.buttonStyles[button] = True
 
     def button_normal(self, button):
         self.w[button].setStyleSheet( \
@@ -4316,6 +5013,7 @@ class HandlerClass:
                      QPushButton:pressed {{ color: {0}; background: {1} }} \
                      QPushButton:disabled {{ color: {2}}}' \
                      .format(self.foreColor, self.backColor, self.disabledColor))
+        self.buttonStyles[button] = False
 
 
 #########################################################################################################################
@@ -5041,8 +5739,7 @@ class HandlerClass:
     def sheet_align(self, button_state, button, offsetX, offsetY):
         if button_state == 'markedge':
             zAngle = self.w.camview.rotation = 0
-            ACTION.CALL_MDI_WAIT('G10 L2 P0 R0', 3)
-            ACTION.SET_MANUAL_MODE()
+            self.mdiQueue.put('G10 L2 P0 R0', ACTION.SET_MANUAL_MODE, timeout=3, timedOut=self.mark_edge_timed_out)
             self.w.gcodegraphics.logger.clear()
             self.w.cam_goto.setEnabled(False)
             button.setText(_translate('HandlerClass', 'SET\nORIGIN'))
@@ -5079,18 +5776,34 @@ class HandlerClass:
             else:
                 zAngle = 0
             self.w.camview.rotation = zAngle
-            ACTION.CALL_MDI_WAIT('G10 L20 P0 X{} Y{}'.format(offsetX, offsetY))
-            ACTION.CALL_MDI_WAIT('G10 L2 P0 R{}'.format(zAngle))
-            ACTION.CALL_MDI('G0 X0 Y0')
-            while not STATUS.is_interp_idle():
-                self.w.gcodegraphics.updateGL()
-            if self.fileOpened == True:
-                self.file_reload_clicked()
-                self.w.gcodegraphics.logger.clear()
-            self.w.cam_goto.setEnabled(True)
-            ACTION.SET_MANUAL_MODE()
+            commands = ['G10 L20 P0 X{} Y{}'.format(offsetX, offsetY), 'G10 L2 P0 R{}'.format(zAngle), 'G0 X0 Y0']
+            self.mdiQueue.put(commands, self.sheet_align_done, timeout=self.moveTimeout, timedOut=self.sheet_align_timed_out)
         return button_state
 
+    def sheet_align_done(self):
+        if self.mdiQueue.aborted:
+            return
+        if self.fileOpened == True:
+            self.file_reload_clicked()
+            self.w.gcodegraphics.logger.clear()
+        self.w.cam_goto.setEnabled(True)
+        ACTION.SET_MANUAL_MODE()
+
+    def sheet_align_timed_out(self):
+        self.move_timed_out()
+        self.w.cam_goto.setEnabled(True)
+
+    def mark_edge_timed_out(self):
+        head = _translate('HandlerClass', 'Offset Error')
+        msg0 = _translate('HandlerClass', 'Rotation was not cleared within')
+        STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{} 3 s\n'.format(head, msg0))
+        ACTION.SET_MANUAL_MODE()
+
+    def move_timed_out(self):
+        head = _translate('HandlerClass', 'Motion Error')
+        msg0 = _translate('HandlerClass', 'Move did not complete within')
+        STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{} {} s\n'.format(head, msg0, self.moveTimeout))
+
     def cam_mark_clicked(self):
         xPos = STATUS.get_position()[0][0] - self.camOffsetX
         yPos = STATUS.get_position()[0][1] - self.camOffsetY
@@ -5102,10 +5815,7 @@ class HandlerClass:
         self.camButtonState = self.sheet_align(self.camButtonState, self.w.cam_mark, self.camOffsetX, self.camOffsetY)
 
     def cam_goto_clicked(self):
-        ACTION.CALL_MDI_WAIT('G0 X0 Y0')
-        while not STATUS.is_interp_idle():
-            self.w.gcodegraphics.updateGL()
-        ACTION.SET_MANUAL_MODE()
+        self.mdiQueue.put('G0 X0 Y0', ACTION.SET_MANUAL_MODE, timeout=self.moveTimeout, timedOut=self.move_timed_out)
 
     def cam_zoom_plus_pressed(self):
         if self.w.camview.scale >= 5:
@@ -5136,10 +5846,11 @@ class HandlerClass:
 # STATISTICS FUNCTIONS #
 #########################################################################################################################
     def statistics_show(self):
-        for stat in ['cut', 'paused', 'probe', 'run', 'torch', 'rapid']:
-            self.display_hms('{}_time'.format(stat), hal.get_value('plasmac.{}-time'.format(stat)))
-        self.w.cut_length.setText('{:0.2f}'.format(hal.get_value('plasmac.cut-length') / self.statsDivisor))
-        self.w.pierce_count.setText('{:d}'.format(hal.get_value('plasmac.pierce-count')))
+        if 'statistics' in self.tabsLoaded:
+            for stat in ['cut', 'paused', 'probe', 'run', 'torch', 'rapid']:
+                self.display_hms('{}_time'.format(stat), hal.get_value('plasmac.{}-time'.format(stat)))
+            self.w.cut_length.setText('{:0.2f}'.format(hal.get_value('plasmac.cut-length') / self.statsDivisor))
+            self.w.pierce_count.setText('{:d}'.format(hal.get_value('plasmac.pierce-count')))
         self.statistics_load()
 
     def statistics_save(self, reset=False):
@@ -5163,6 +5874,8 @@ class HandlerClass:
         self.statsSaved['rapid'] = self.PREFS.getpref('Rapid time', 0 , float,'STATISTICS')
         self.statsSaved['length'] = self.PREFS.getpref('Cut length', 0 , float,'STATISTICS')
         self.statsSaved['pierce'] = self.PREFS.getpref('Pierce count', 0 , int,'STATISTICS')
+        if 'statistics' not in self.tabsLoaded:
+            return
         for stat in ['cut', 'paused', 'probe', 'run', 'torch', 'rapid']:
             self.display_hms('{}_time_t'.format(stat), self.statsSaved['{}'.format(stat)])
         self.w.cut_length_t.setText('{:0.2f}'.format(self.statsSaved['length'] / self.statsDivisor))
@@ -5211,36 +5924,70 @@ class HandlerClass:
 #########################################################################################################################
 # POWERMAX COMMUNICATIONS FUNCTIONS #
 #########################################################################################################################
-    def pmx485_check(self, port, periodic=False):
+    def pmx485_check(self, port, periodic=False, portError=None):
+        if portError is None:
+            portError = self.pmx485_port_error(port)
+        if portError and not periodic:
+            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, portError)
+        return not portError
+
+    # this may run in a worker thread so it returns the error text rather than emitting it
+    def pmx485_port_error(self, port):
         try:
             import serial
             import serial.tools.list_ports as PORTS
-            head = _translate('HandlerClass', 'Port Error')
-            msg1 = _translate('HandlerClass', 'Powermax communications are disabled')
-            ports = []
-            for p in PORTS.comports():
-                ports.append(p[0])
-            if port in ports:
-                try:
-                    sPort = serial.Serial(port, 19200)
-                    sPort.close()
-                except Exception as err:
-                    if not periodic:
-                        STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}\n{}'.format(head, err, msg1))
-                    return False
-            else:
-                if not periodic:
-                    msg0 = _translate('cannot be found')
-                    STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{} {}\n{}'.format(head, port, msg0, msg1))
-                return False
         except:
-            if not periodic:
-                head = _translate('HandlerClass', 'Module Error')
-                msg0 = _translate('HandlerClass', 'python3-serial cannot be found')
-                msg1 = _translate('HandlerClass', 'Install python3-serial or linuxcnc-dev')
-            STATUS.emit('error', linuxcnc.OPERATOR_ERROR, '{}:\n{}\n{}'.format(head, msg0, msg1))
-            return False
-        return True
+            head = _translate('HandlerClass', 'Module Error')
+            msg0 = _translate('HandlerClass', 'python3-serial cannot be found')
+            msg1 = _translate('HandlerClass', 'Install python3-serial or linuxcnc-dev')
+            return '{}:\n{}\n{}'.format(head, msg0, msg1)
+        head = _translate('HandlerClass', 'Port Error')
+        msg1 = _translate('HandlerClass', 'Powermax communications are disabled')
+        ports = []
+        for p in PORTS.comports():
+            ports.append(p[0])
+        if port not in ports:
+            msg0 = _translate('HandlerClass', 'cannot be found')
+            return '{}:\n{} {}\n{}'.format(head, port, msg0, msg1)
+        try:
+            sPort = serial.Serial(port, 19200)
+            sPort.close()
+        except Exception as err:
+            return '{}:\n{}\n{}'.format(head, err, msg1)
+        return ''
+
+    # wait in the background for the powermax port to be plugged in
+    def pmx485_watch(self, delay=0.5):
+        self.pmx485_watch_stop()
+        self.pmx485Watcher = PortWatcher(self.pmPort, self.pmx485_port_error, delay)
+        self.pmx485Watcher.paused = self.scheduler.suspended
+        self.pmx485Watcher.portFound.connect(self.pmx485_port_found)
+        self.pmx485Watcher.start()
+
+    # don't probe for the powermax port while cutting
+    def pmx485_watch_suspend(self, busy):
+        if self.pmx485Watcher:
+            self.pmx485Watcher.paused = busy
+
+    # the old watcher thread must have finished before it is replaced
+    def pmx485_watch_stop(self):
+        if self.pmx485Watcher:
+            self.pmx485Watcher.requestInterruption()
+            self.pmx485Watcher.wait()
+            self.pmx485Watcher.deleteLater()
+            self.pmx485Watcher = None
+
+    def pmx485_port_found(self, port):
+        self.w.gas_pressure.show()
+        self.w.gas_pressure_label.show()
+        self.w.cut_mode.show()
+        self.w.cut_mode_label.show()
+        self.w.pmx485_frame.show()
+        self.w.pmx_stats_frame.show()
+        self.pmx485_startup(port)
+        # the component failed to load so try again later
+        if not hal.component_exists('pmx485'):
+            self.pmx485_watch(self.pmx485Watcher.maxDelay)
 
     def pmx485_startup(self, port):
         self.pmx485CommsError = False
@@ -5630,6 +6377,8 @@ class HandlerClass:
         self.estopColor = self.PREFS.getpref('Estop', '#ff0000', str, 'COLOR_OPTIONS')
 
     def set_color_styles(self):
+        # colors may have changed so restyle user buttons on the next update
+        self.buttonStyles = {}
         self.styleSheetFile = os.path.join(self.PATHS.CONFIGPATH, 'qtplasmac.qss')
         ssFile = self.PREFS.getpref('Custom style', 'None', str, 'GUI_OPTIONS')
         # if custom stylesheet try to use it
@@ -5765,11 +6514,7 @@ class HandlerClass:
 
     def color_item(self, item, color, type):
         image_path = '{}{}.svg'.format(self.IMAGES, item)
-        self.image = QPixmap(image_path)
-        colorChange = QPainter(self.image)
-        colorChange.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        colorChange.fillRect( self.image.rect(), QColor(color) )
-        colorChange.end()
+        self.image = self.pixmapCache.get(image_path, color)
         if type == 'button':
             self.w[item].setIcon(QIcon(self.image))
         elif type == 'image':
@@ -5834,6 +6579,10 @@ class HandlerClass:
         if self.key_is_valid(event, state):
             self.STYLEEDITOR.load_dialog()
 
+    def on_keycall_F11(self, event, state, shift, cntrl):
+        if self.key_is_valid(event, state):
+            self.callback_timing_show()
+
     def on_keycall_F9(self, event, state, shift, cntrl):
         if self.key_is_valid(event, state) and not self.w.main_tab_widget.currentIndex() \
            and not self.probeTest and not self.torchPulse and not self.framing and STATUS.is_interp_idle():
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+'''
+test_mdi_queue.py
+
+Tests for the MDI queue and for aborting queued handler work, the handler
+tests use the stub modules and widgets from handler_benchmark.py
+
+usage: python3 -m unittest test_mdi_queue
+
+This program is free software; you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the
+Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+'''
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+from mdi_queue import MdiQueue
+
+try:
+    import PyQt5
+except ImportError:
+    PyQt5 = None
+
+# records connections so the idle signals can be emitted by the tests
+class Status:
+    def __init__(self):
+        self.callbacks = {}
+        self.idle = True
+
+    def connect(self, signal, callback):
+        self.callbacks.setdefault(signal, []).append(callback)
+
+    def emit(self, signal):
+        for callback in self.callbacks.get(signal, []):
+            callback(self)
+
+    def is_interp_idle(self):
+        return self.idle
+
+class MdiQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.status = Status()
+        self.sent = []
+        self.queue = MdiQueue(self.status, self.sent.append, abort=lambda: self.sent.append('ABORT'))
+
+    def run_queue(self):
+        while self.queue.depth():
+            self.status.emit('interp-idle')
+
+    def test_offsets_and_moves_keep_order(self):
+        self.queue.put('G0 X0 Y0')
+        self.queue.put('G10 L20 P0 X0 Y0')
+        self.queue.put('G0 X10 Y10')
+        self.queue.put('G10 L2 P0 R0')
+        self.run_queue()
+        self.assertEqual(self.sent, ['G0 X0 Y0', 'G10 L20 P0 X0 Y0', 'G0 X10 Y10', 'G10 L2 P0 R0'])
+
+    def test_adjacent_offset_writes_coalesce(self):
+        done = []
+        self.queue.put('G0 X0 Y0')
+        for n in range(3):
+            self.queue.put('G10 L20 P0 X{0} Y{0}'.format(n), lambda: done.append(True))
+        self.run_queue()
+        self.assertEqual(self.sent, ['G0 X0 Y0', 'G10 L20 P0 X2 Y2'])
+        self.assertEqual(self.queue.coalesced, 2)
+
+    def test_separated_offset_writes_do_not_coalesce(self):
+        self.queue.put('G0 X0 Y0')
+        self.queue.put('G10 L20 P0 X1 Y1')
+        self.queue.put('G0 X5 Y5')
+        self.queue.put('G10 L20 P0 X2 Y2')
+        self.run_queue()
+        self.assertEqual(self.sent, ['G0 X0 Y0', 'G10 L20 P0 X1 Y1', 'G0 X5 Y5', 'G10 L20 P0 X2 Y2'])
+
+    def test_smaller_offset_write_does_not_coalesce(self):
+        self.queue.put('G0 X0 Y0')
+        self.queue.put('G10 L2 P0 X1 Y1 R5')
+        self.queue.put('G10 L2 P0 R0')
+        self.run_queue()
+        self.assertEqual(self.sent, ['G0 X0 Y0', 'G10 L2 P0 X1 Y1 R5', 'G10 L2 P0 R0'])
+
+    def test_abort_calls_done_with_aborted_set(self):
+        aborted = []
+        self.queue.put(['G20', 'o<frame> call', 'G21'], lambda: aborted.append(self.queue.aborted))
+        self.queue.put('G0 X0 Y0', lambda: aborted.append(self.queue.aborted))
+        self.queue.abort()
+        self.assertEqual(self.sent, ['G20', 'ABORT'])
+        self.assertEqual(aborted, [True, True])
+        self.assertFalse(self.queue.aborted)
+        self.assertEqual(self.queue.depth(), 0)
+
+    def test_touch_off_only_coalesces_behind_offsets(self):
+        command = 'G10 L20 P0 X1 Y1'
+        self.assertFalse(self.queue.coalesces(command))
+        self.queue.put('G10 L20 P0 X0 Y0')
+        self.assertTrue(self.queue.coalesces(command))
+        self.queue.put('G0 X0 Y0')
+        self.assertFalse(self.queue.coalesces(command))
+
+    def test_timeout_aborts_and_holds_queue(self):
+        done, timedOut = [], []
+        self.status.idle = False
+        self.queue.put('G0 X0 Y0', lambda: done.append(True), timeout=0.001, timedOut=lambda: timedOut.append(True))
+        self.queue.put('G0 X10 Y10')
+        time.sleep(0.01)
+        self.status.emit('periodic')
+        self.assertEqual(self.sent, ['G0 X0 Y0', 'ABORT'])
+        self.assertEqual((done, timedOut), ([], [True]))
+        self.assertFalse(self.queue.coalesces('G10 L20 P0 X1 Y1'))
+        self.status.idle = True
+        self.status.emit('interp-idle')
+        self.assertEqual(self.sent, ['G0 X0 Y0', 'ABORT', 'G0 X10 Y10'])
+
+    def test_clear_calls_done(self):
+        done = []
+        self.queue.put('G0 X0 Y0', lambda: done.append(self.queue.aborted))
+        self.queue.clear()
+        self.assertEqual(done, [True])
+        self.assertNotIn('ABORT', self.sent)
+
+@unittest.skipUnless(PyQt5, 'PyQt5 is required to construct the handler')
+class HandlerAbortTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+        from PyQt5.QtWidgets import QApplication
+        import handler_benchmark
+        cls.cwd = os.getcwd()
+        cls.app = QApplication.instance() or QApplication([])
+        cls.bench = handler_benchmark.Benchmark(1)
+        cls.bench.construct()
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls.cwd)
+        cls.bench.cleanup()
+
+    def test_abort_framing(self):
+        import qtplasmac_handler
+        handler = self.bench.handler
+        status = self.bench.status
+        extents = '10.000 to 100.000 = 90.000 mm'
+        handler.update_gcode_properties({'gcode_units': 'mm', 'x': extents, 'y': extents, \
+                                         'x_zero_rxy': extents, 'y_zero_rxy': extents})
+        status.stat.g5x_offset = [0] * 9
+        status.stat.rotation_xy = 0
+        status.is_on_and_idle.return_value = True
+        status.is_all_homed.return_value = True
+        handler.frFeed = 1000
+        handler.defaultZ = True
+        handler.laserOnPin.set(1)
+        handler.frame_job(True)
+        self.assertTrue(handler.framing)
+        self.assertTrue(handler.mdiQueue.depth())
+        handler.abort_pressed()
+        qtplasmac_handler.ACTION.ABORT.assert_called()
+        self.assertFalse(handler.framing)
+        self.assertEqual(handler.laserOnPin.get(), 0)
+        self.assertEqual(handler.mdiQueue.depth(), 0)
+
+if __name__ == '__main__':
+    unittest.main()